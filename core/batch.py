@@ -0,0 +1,97 @@
+"""Headless QC run over a folder of SurveyCTO exports, one issues workbook per reviewer.
+
+    python -m core.batch EXPORTS_DIR QC_LOG_FILE OUT_DIR [--workers N] [--no-cache]
+
+Exports are matched to rule sets by file name ("Tool 1 CBE Classroom and Teacher.xlsx"
+-> Tool 1). QC_LOG_FILE is a QC_Log snapshot saved as .xlsx or .csv.
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from core.helpers import read_tool_workbook, reviewer_names
+from core.pipeline import run_pipeline, tool_of
+
+
+def find_exports(folder) -> dict:
+    """Tool name -> export path, for every export in `folder` that has a rule set."""
+    found = {}
+    for name in sorted(os.listdir(folder)):
+        tool = tool_of(name)
+        if tool:
+            found[tool] = os.path.join(folder, name)
+    return found
+
+
+def read_qc_log(path) -> pd.DataFrame:
+    if path.lower().endswith(".csv"):
+        df = pd.read_csv(path, dtype=str)
+    else:
+        df = pd.read_excel(path, dtype=str)
+    df = df.fillna("")
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def check_exports(exports: dict, df_qc: pd.DataFrame, workers=None, use_cache=True) -> dict:
+    """Tool name -> issues table over every APPROVED key in QC_Log."""
+    workbooks = {tool: read_tool_workbook(path) for tool, path in exports.items()}
+    issues = run_pipeline(workbooks, df_qc, workers=workers, use_cache=use_cache)
+    return {tool: issues[issues["Tool"] == tool] for tool in workbooks}
+
+
+def write_workbook(path, sheets: dict):
+    """One sheet per tool, same columns as the QC pages' download."""
+    with pd.ExcelWriter(path) as writer:
+        for tool, df in sheets.items():
+            df.to_excel(writer, sheet_name=tool, index=False)
+    return path
+
+
+def write_reviewer_workbooks(results: dict, out_dir, workers=None) -> list:
+    """QC_Issues_<reviewer>.xlsx for every reviewer with issues, plus QC_Issues_All.xlsx.
+
+    File names come from reviewer_names, so two reviewers never share a workbook.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = {os.path.join(out_dir, "QC_Issues_All.xlsx"): results}
+    reviewers = sorted({r for df in results.values() for r in df["QA_By"]})
+    names = reviewer_names(reviewers, reserved=["All"])
+    for reviewer in reviewers:
+        sheets = {tool: df[df["QA_By"] == reviewer] for tool, df in results.items()}
+        sheets = {tool: df for tool, df in sheets.items() if not df.empty}
+        jobs[os.path.join(out_dir, f"QC_Issues_{names[reviewer]}.xlsx")] = sheets
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(write_workbook, jobs, jobs.values()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Tool QC checks without Streamlit.")
+    parser.add_argument("exports", help="folder with the SurveyCTO exports (Tool 1 ... .xlsx)")
+    parser.add_argument("qc_log", help="QC_Log snapshot (.xlsx or .csv)")
+    parser.add_argument("out", help="folder for the per-reviewer issues workbooks")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: every core)")
+    parser.add_argument("--no-cache", action="store_true", help="re-check every submission")
+    args = parser.parse_args(argv)
+
+    exports = find_exports(args.exports)
+    if not exports:
+        print(f"No Tool exports with QC rules found in {args.exports}", file=sys.stderr)
+        return 1
+
+    df_qc = read_qc_log(args.qc_log)
+    results = check_exports(exports, df_qc, workers=args.workers, use_cache=not args.no_cache)
+    for tool, df in results.items():
+        print(f"{tool}: {len(df)} issues")
+
+    written = write_reviewer_workbooks(results, args.out, workers=args.workers)
+    print(f"{len(written)} workbooks written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
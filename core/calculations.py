@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# SurveyCTO submission KEYs: "uuid:" and a lowercase 8-4-4-4-12 hex UUID
+UUID_KEY_RE = r"^uuid:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+
+_HEX = np.zeros(256, dtype=np.uint8)
+_HEX[np.frombuffer(b"0123456789abcdef", dtype=np.uint8)] = np.arange(16, dtype=np.uint8)
+
+
+def _key_strings(keys) -> pa.Array:
+    """Stripped KEYs as one Arrow string array; missing KEYs become ""."""
+    if isinstance(keys, pd.Series) and not isinstance(keys.dtype, pd.StringDtype):
+        keys = keys.astype("string[pyarrow]")
+    arr = pa.array(keys, type=pa.large_string(), from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    return pc.utf8_trim_whitespace(arr.fill_null(""))
+
+
+# Offsets of the 32 hex digits within a 41-character uuid: KEY
+_HEX_DIGITS = np.r_[5:13, 14:18, 19:23, 24:28, 29:41]
+
+
+def _uuid_bytes(keys: pa.Array) -> pa.Array:
+    """uuid: KEYs (all valid, so all 41 bytes long) packed into 16-byte values."""
+    if len(keys) == 0:
+        return pa.array([], type=pa.binary(16))
+    offsets = np.frombuffer(keys.buffers()[1], dtype=np.int64)[keys.offset:keys.offset + len(keys) + 1]
+    raw = np.frombuffer(keys.buffers()[2], dtype=np.uint8)[offsets[0]:offsets[-1]].reshape(-1, 41)
+    nibbles = _HEX[raw[:, _HEX_DIGITS]]
+    packed = (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+    return pa.FixedSizeBinaryArray.from_buffers(pa.binary(16), len(keys), [None, pa.py_buffer(packed.tobytes())])
+
+
+def key_arrays(*columns) -> list:
+    """The KEY columns in one compact, comparable Arrow encoding.
+
+    When every KEY on every side is a SurveyCTO uuid, each is packed into 16 bytes
+    (the 128-bit UUID); otherwise they are compared as stripped strings.
+    """
+    arrays = [_key_strings(c) for c in columns]
+    if all(pc.all(pc.match_substring_regex(a, UUID_KEY_RE)).as_py() is not False for a in arrays):
+        return [_uuid_bytes(a) for a in arrays]
+    return arrays
+
+
+def missing_keys(keys, existing) -> np.ndarray:
+    """Anti-join: True where a KEY of `keys` is not among `existing` (a hash lookup in Arrow)."""
+    keys, existing = key_arrays(keys, existing)
+    return ~pc.is_in(keys, value_set=existing).to_numpy(zero_copy_only=False)
+
+
+def key_positions(keys, existing) -> np.ndarray:
+    """Row in `existing` of each KEY of `keys` (its first occurrence), or -1."""
+    keys, existing = key_arrays(keys, existing)
+    return pc.index_in(keys, value_set=existing).fill_null(-1).to_numpy(zero_copy_only=False).astype(np.intp)
+
+
+def join_on_key(left: pd.DataFrame, right: pd.DataFrame, columns, fill="") -> pd.DataFrame:
+    """Left join of `right`'s `columns` onto `left` by KEY; first match wins, unmatched rows get `fill`."""
+    positions = key_positions(left["KEY"], right["KEY"])
+    out = left.copy()
+    for c in columns:
+        out[c] = right[c].array.take(positions, allow_fill=True, fill_value=fill)
+    return out
@@ -0,0 +1,193 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import gspread
+import pandas as pd
+import streamlit as st
+from google.auth.transport.requests import AuthorizedSession, Request
+from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+
+from core.sheet_mirror import grid_frame
+from core.storage import GoogleSheetStorage, LocalSheetStorage, SheetStorage
+
+SPREADSHEET_KEY = "1lkztBZ4eG1BQx-52XgnA6w8YIiw-Sm85pTlQQziurfw"
+QC_LOG_SHEET = "QC_Log"
+CORRECTION_LOG_SHEET = "Correction_Log"
+SAMPLE_TRACK_SHEET = "Test"
+ISSUES_SHEET = "QC_Issues"
+SERVICE_ACCOUNT_FILE = r"C:\Users\LENOVO\CBE_Dashboard\service_account.json"
+READONLY_SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+WRITE_SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+
+# Keep-alive HTTPS connections each pooled client holds for concurrent sessions
+POOL_CONNECTIONS = 10
+
+# Seconds a fetch of the mirrored sheets is shared by every page and session; override with CBE_SHEETS_TTL
+SHEETS_TTL = int(os.environ.get("CBE_SHEETS_TTL", 600))
+
+# Folder of worksheet CSV files to use instead of the spreadsheet (offline runs, profiling, CI)
+LOCAL_STORAGE_DIR = os.environ.get("CBE_STORAGE_DIR")
+
+# Mirrored worksheets and the columns edited in place after a row is appended; a sync
+# re-checks only those columns. None: small sheet edited anywhere, re-downloaded in full.
+MIRRORED_SHEETS = {
+    QC_LOG_SHEET: ["KEY", "QC By", "Status", "Remark"],
+    CORRECTION_LOG_SHEET: None,
+    SAMPLE_TRACK_SHEET: None,
+}
+
+# The QC_Log columns any page reads (the ones verified); only these are mirrored and downloaded
+QC_LOG_COLUMNS = MIRRORED_SHEETS[QC_LOG_SHEET]
+MIRRORED_COLUMNS = {QC_LOG_SHEET: QC_LOG_COLUMNS}
+
+
+def get_credentials(scopes=READONLY_SCOPES):
+    """Service account from Streamlit secrets (gcp_service_account), else the local key file."""
+    try:
+        info = st.secrets["gcp_service_account"]
+    except Exception:
+        return Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=scopes)
+    return Credentials.from_service_account_info(info, scopes=scopes)
+
+
+_token_lock = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def _pooled_client(scopes) -> gspread.Client:
+    session = AuthorizedSession(get_credentials(list(scopes)))
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_CONNECTIONS)
+    session.mount("https://", adapter)
+    return gspread.authorize(session.credentials, session=session)
+
+
+def get_client(write=False) -> gspread.Client:
+    """The process-wide gspread client, shared by every session and thread.
+
+    Authorized once per process; its token is refreshed here (under a lock, so only one
+    thread does it) once google-auth considers it close to expiry.
+    """
+    client = _pooled_client(tuple(WRITE_SCOPES if write else READONLY_SCOPES))
+    creds = client.http_client.session.credentials
+    if not creds.valid:
+        with _token_lock:
+            if not creds.valid:
+                creds.refresh(Request())
+    return client
+
+
+@st.cache_resource(show_spinner=False)
+def _storage() -> SheetStorage:
+    if LOCAL_STORAGE_DIR:
+        return LocalSheetStorage(LOCAL_STORAGE_DIR)
+    return GoogleSheetStorage(get_client().open_by_key(SPREADSHEET_KEY),
+                              get_client(write=True).open_by_key(SPREADSHEET_KEY),
+                              verify=MIRRORED_SHEETS, columns=MIRRORED_COLUMNS)
+
+
+def get_storage() -> SheetStorage:
+    """Where the app reads and writes its worksheets (see core.storage).
+
+    The project spreadsheet, or the CSV files in CBE_STORAGE_DIR when that is set.
+    """
+    if not LOCAL_STORAGE_DIR:
+        get_client()
+        get_client(write=True)
+    return _storage()
+
+
+# Low-cardinality columns loaded as categoricals, and columns loaded stripped
+CATEGORY_COLUMNS = {QC_LOG_SHEET: ["QC By", "Status"]}
+STRIP_COLUMNS = {QC_LOG_SHEET: ["KEY", "QC By"]}
+
+
+def _frame(name, header, rows) -> pd.DataFrame:
+    df = grid_frame(header, rows, categories=CATEGORY_COLUMNS.get(name, ()), strip=STRIP_COLUMNS.get(name, ()))
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def _content_checksum(header, rows) -> str:
+    return hashlib.sha1(json.dumps([header, rows], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+# Last frame built per (sheet, columns), with the checksum of the values it was built from
+_frames = {}
+_frames_lock = threading.Lock()
+
+
+def _cached_frame(name, columns, header, rows):
+    """The frame for a grid, reused as is when the grid's content hasn't changed since the last read."""
+    checksum = _content_checksum(header, rows)
+    key = (name, tuple(columns) if columns is not None else None)
+    with _frames_lock:
+        found = _frames.get(key)
+    if found is None or found[0] != checksum:
+        found = (checksum, _frame(name, header, rows))
+        with _frames_lock:
+            _frames[key] = found
+    return found
+
+
+def load_sheets(names=tuple(MIRRORED_SHEETS), columns=None) -> dict:
+    """Read the worksheets `names` together, each as a typed frame.
+
+    From the spreadsheet, all of them are delta-synced through one client and one
+    batched values request (see SheetMirror.sync_many). Values are the sheet's text
+    (pyarrow strings), not get_all_records' guessed numbers. `columns` maps a name to
+    the columns to build the frame from (the rest are never parsed). A sheet whose
+    values haven't changed since the last read gets the same frame back, unparsed.
+    """
+    # Shallow copies: pages add or replace columns on what they get back
+    return {name: frame.copy(deep=False) for name, (_, frame) in _load_versioned(names, columns).items()}
+
+
+def _load_versioned(names, columns=None) -> dict:
+    columns = columns or {}
+    grids = get_storage().read_many(names, columns)
+    return {name: _cached_frame(name, columns.get(name), *grids[name]) for name in names}
+
+
+def load_sheet(name, columns=None) -> pd.DataFrame:
+    """One worksheet, synced now (for pages that write back and can't read a cached copy)."""
+    return load_sheets([name], {name: columns})[name]
+
+
+# A resource, not data: the frames are shared as is (never pickled) and callers get shallow copies
+@st.cache_resource(ttl=SHEETS_TTL, show_spinner="Loading Google Sheets...")
+def _fetch_sheets():
+    return _load_versioned(tuple(MIRRORED_SHEETS)), time.time()
+
+
+def load_cached_sheet(name, columns=None) -> pd.DataFrame:
+    """A mirrored worksheet as of the app-wide fetch of all of them, at most SHEETS_TTL old."""
+    df = _fetch_sheets()[0][name][1]
+    return df.copy(deep=False) if columns is None else df[[c for c in df.columns if c in columns]]
+
+
+def cached_sheet_version(name) -> str:
+    """Checksum of the values behind load_cached_sheet(name).
+
+    Key derived views on it so a refresh rebuilds them only when the sheet's content changed.
+    """
+    return _fetch_sheets()[0][name][0]
+
+
+def load_qc_log(columns=QC_LOG_COLUMNS) -> pd.DataFrame:
+    """QC_Log as a DataFrame, synced from the sheet at most once per SHEETS_TTL for the whole app."""
+    return load_cached_sheet(QC_LOG_SHEET, columns)
+
+
+def qc_log_refresh_control():
+    """Shows when the sheets were fetched, with a button to drop the cached copies and fetch them again."""
+    _, fetched_at = _fetch_sheets()
+    col_info, col_button = st.columns([4, 1])
+    col_info.caption(f"Sheets loaded at {time.strftime('%H:%M:%S', time.localtime(fetched_at))}"
+                     f" (refreshed automatically every {SHEETS_TTL // 60} min)")
+    if col_button.button("🔄 Refresh sheets"):
+        _fetch_sheets.clear()
+        st.rerun()
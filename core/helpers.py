@@ -0,0 +1,89 @@
+import hashlib
+import re
+
+import pandas as pd
+
+from core.workbook_cache import read_workbook
+
+_PERSO_ARABIC_RE = re.compile(r'[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]')
+
+# QC_Log columns the QC pages read, and the names they get once joined onto a tool export
+QC_LOG_FIELDS = {"QC By": "QC_By", "Status": "QC_Status", "Remark": "QC_Remark"}
+
+
+def read_tool_workbook(file):
+    """Read a SurveyCTO long-format export: the main sheet plus its repeat-group sheets.
+
+    Returns (df_main, repeats) where `repeats` maps sheet name to every other sheet that
+    has a PARENT_KEY column. All sheets are read once, as text, and cached by content
+    (see core.workbook_cache).
+    """
+    sheets = read_workbook(file, dtype=str)
+    names = list(sheets)
+    df = sheets[names[0]].fillna("")
+    repeats = {n: sheets[n].fillna("") for n in names[1:] if "PARENT_KEY" in sheets[n].columns}
+    return df, repeats
+
+
+def index_qc_log(df_qc: pd.DataFrame) -> pd.DataFrame:
+    """QC_Log fields indexed by KEY (first row wins), built once per run."""
+    qc = df_qc.reindex(columns=["KEY", *QC_LOG_FIELDS]).fillna("").astype(str)
+    for c in qc.columns:
+        qc[c] = qc[c].str.strip()
+    qc = qc[qc["KEY"] != ""].drop_duplicates(subset="KEY", keep="first")
+    return qc.set_index("KEY").rename(columns=QC_LOG_FIELDS)
+
+
+def join_qc_log(df_tool: pd.DataFrame, df_qc: pd.DataFrame, status_column: str) -> pd.DataFrame:
+    """Keyed join of a tool export with QC_Log.
+
+    Rows without a KEY, without a QC_Log entry, or whose `status_column` is not
+    APPROVED are dropped before any check runs. `status_column` is either a column of
+    the export (e.g. "review_status") or one of the joined QC_Log fields ("QC_Status").
+    """
+    return join_indexed_qc_log(df_tool, index_qc_log(df_qc), status_column)
+
+
+def join_indexed_qc_log(df_tool: pd.DataFrame, qc_index: pd.DataFrame, status_column: str) -> pd.DataFrame:
+    """join_qc_log against an index_qc_log result, so several exports can share one index."""
+    df = df_tool.copy()
+    df["KEY"] = df["KEY"].astype(str).str.strip() if "KEY" in df.columns else ""
+    df = df[df["KEY"] != ""]
+    df = df.join(qc_index, on="KEY", how="inner")
+
+    status = df.get(status_column, pd.Series("", index=df.index)).astype(str).str.strip().str.upper()
+    return df[status == "APPROVED"].reset_index(drop=True)
+
+
+def contains_perso_arabic(values: pd.Series) -> pd.Series:
+    """Vectorized _PERSO_ARABIC_RE search: True where a cell has Dari/Pashto letters."""
+    return values.fillna("").astype(str).str.contains(_PERSO_ARABIC_RE).astype(bool)
+
+
+def choice_index(values: pd.Series) -> pd.DataFrame:
+    """One-hot membership of a select_multiple column: one bool column per choice code.
+
+    Answers ("1 8888" or "1,8888") are split on commas and whitespace once for the whole
+    column, so "includes 8888" is a column lookup and the choice count a row sum.
+    """
+    codes = values.fillna("").astype(str).str.replace(r'[,\s]+', " ", regex=True).str.strip()
+    return codes.str.get_dummies(sep=" ").astype(bool)
+
+
+def reviewer_names(reviewers, reserved=()) -> dict:
+    """File- and worksheet-safe name per reviewer, the same whoever else is named with them.
+
+    Spaces become "_" ("Meena Yawari" -> "Meena_Yawari"). When that can't be undone (other
+    characters dropped, an "_" in the name, a blank name) or gives one of `reserved`, a
+    short hash of the raw name is appended, so no two reviewers ever share a name.
+    """
+    names = {}
+    for reviewer in dict.fromkeys(reviewers):
+        raw = str(reviewer)
+        safe = re.sub(r"[^\w.-]+", "_", raw).strip("_.-") or "Unassigned"
+        if safe.replace("_", " ") != raw or safe in reserved:
+            safe = f"{safe}_{hashlib.sha1(raw.encode('utf-8')).hexdigest()[:8]}"
+        names[reviewer] = safe
+    if len(set(names.values()) | set(reserved)) != len(names) + len(set(reserved)):
+        raise ValueError("reviewer names collide: " + ", ".join(map(repr, names)))
+    return names
@@ -0,0 +1,91 @@
+import hashlib
+import time
+
+import pandas as pd
+
+from core.helpers import index_qc_log, reviewer_names
+from core.qc_engine import ISSUE_COLUMNS
+
+# Columns the app writes to the issues worksheet; columns reviewers add to its right are kept
+PUBLISHED_COLUMNS = ["Issue_ID", "Reviewer", *ISSUE_COLUMNS, "Published_At"]
+
+# What identifies an issue from one run to the next
+ID_FIELDS = ["Tool", "KEY", "Question_Label", "Issue", "Choice"]
+
+
+def issue_ids(issues: pd.DataFrame) -> pd.Series:
+    """Stable ID per issue: a hash of ID_FIELDS, plus its occurrence among identical issues."""
+    fields = issues[ID_FIELDS].astype(str)
+    occurrence = fields.groupby(ID_FIELDS, sort=False).cumcount().astype(str)
+    text = occurrence
+    for c in ID_FIELDS:
+        text = fields[c] + "\x1f" + text
+    return text.map(lambda t: hashlib.sha1(t.encode("utf-8")).hexdigest()[:12])
+
+
+def reviewer_sheets(name, reviewers) -> dict:
+    """Reviewer -> the worksheet holding their issues, e.g. "QC_Issues_Meena_Yawari".
+
+    Named like core.batch's workbooks (see reviewer_names), so no two reviewers share one.
+    """
+    return {r: f"{name}_{safe}" for r, safe in reviewer_names(reviewers).items()}
+
+
+def _sheet_grid(header, rows, new: pd.DataFrame, tools):
+    """One reviewer's worksheet with the rows of `tools` replaced by `new`, as a grid to write at A1."""
+    width = len(header)
+    first = {}
+    for i, h in enumerate(header):
+        if h.strip() and h.strip() not in first:
+            first[h.strip()] = i
+    extra = [h for h in first if h not in PUBLISHED_COLUMNS]
+    columns = PUBLISHED_COLUMNS + extra
+    old = pd.DataFrame([[r[i] if i < len(r) else "" for i in first.values()] for r in rows],
+                       columns=list(first), dtype=str)
+    old = old.reindex(columns=columns).fillna("")
+    old = old[(old != "").any(axis=1)]
+
+    scope = old["Tool"].isin(list(tools))
+    kept, replaced = old[~scope], old[scope]
+    carried = replaced.drop_duplicates("Issue_ID").set_index("Issue_ID")[extra]
+    new = new.join(carried, on="Issue_ID").reindex(columns=columns).fillna("")
+
+    merged = pd.concat([kept, new], ignore_index=True).sort_values("Tool", kind="stable")
+    grid = [columns] + merged.values.tolist()
+    width = max(width, len(columns))
+    grid = [r + [""] * (width - len(r)) for r in grid]
+    return grid + [[""] * width for _ in range(len(rows) + 1 - len(grid))]
+
+
+def publish_issues(storage, name, issues: pd.DataFrame, df_qc: pd.DataFrame, tools, reviewer="All") -> int:
+    """Replace a reviewer's issues for `tools` with this run's `issues`.
+
+    Each reviewer (from QC_Log's QC By) has a worksheet of their own, see reviewer_sheets,
+    so a publish only ever rewrites the publishing reviewer's rows. All the worksheets
+    involved are read together and written together, so a publish costs the same few
+    requests for one reviewer or for "All" of them (every reviewer in `df_qc`). Rows
+    that no longer exist are blanked, other tools' rows are left as they were, and
+    values in any extra columns carry over by Issue_ID. Returns how many issues were
+    published.
+    """
+    reviewers = index_qc_log(df_qc)["QC_By"]
+    new = issues[ISSUE_COLUMNS].astype(str).copy()
+    new.insert(0, "Issue_ID", issue_ids(new).values)
+    new.insert(1, "Reviewer", new["KEY"].map(reviewers).fillna("").values)
+    new["Published_At"] = time.strftime("%Y-%m-%d %H:%M")
+
+    if reviewer == "All":
+        mine = {r: new[new["Reviewer"] == r] for r in sorted(set(reviewers) | set(new["Reviewer"]))}
+    else:
+        mine = {reviewer: new}
+    sheets = reviewer_sheets(name, mine)
+    grids = storage.read_many(list(sheets.values()))
+
+    updates = {}
+    for r, sheet in sheets.items():
+        header, rows = grids[sheet]
+        if rows or not mine[r].empty:
+            updates[sheet] = [{"range": "A1", "values": _sheet_grid(header, rows, mine[r], tools)}]
+    if updates:
+        storage.batch_update_many(updates)
+    return len(new)
@@ -0,0 +1,44 @@
+import re
+
+import pandas as pd
+
+from core.helpers import index_qc_log, join_indexed_qc_log
+from core.qc_cache import run_incremental
+from core.qc_engine import ISSUE_COLUMNS
+from core.qc_rules import TOOLS, run_tool
+
+_TOOL_FILE_RE = re.compile(r"^(Tool \d+)\b.*\.xlsx$", re.IGNORECASE)
+
+
+def tool_of(file_name):
+    """Rule-set name for an export file ("Tool 1 CBE Classroom and Teacher.xlsx" -> "Tool 1"), or None."""
+    m = _TOOL_FILE_RE.match(file_name)
+    if m is None or file_name.startswith("~$"):
+        return None
+    tool = m.group(1).title()
+    return tool if tool in TOOLS else None
+
+
+def run_pipeline(workbooks: dict, df_qc: pd.DataFrame, workers=1, use_cache=True, profile=None) -> pd.DataFrame:
+    """Every tool's checks in one pass, against one QC_Log index.
+
+    `workbooks` maps tool name to (df_tool, repeats) as returned by read_tool_workbook;
+    `df_qc` is QC_Log (already narrowed to one reviewer if needed). Returns one issues
+    table for all tools, in TOOLS order, told apart by the Tool column.
+    """
+    qc_index = index_qc_log(df_qc)
+    frames = []
+    for tool in TOOLS:
+        if tool not in workbooks:
+            continue
+        df_tool, repeats = workbooks[tool]
+        df_run = join_indexed_qc_log(df_tool, qc_index, status_column=TOOLS[tool].STATUS_COLUMN)
+        if use_cache:
+            issues, _ = run_incremental(tool, df_run, repeats, workers=workers, profile=profile)
+        else:
+            issues = run_tool(tool, df_run, repeats, workers=workers, profile=profile)
+        frames.append(issues)
+
+    if not frames:
+        return pd.DataFrame(columns=ISSUE_COLUMNS)
+    return pd.concat(frames, ignore_index=True)[ISSUE_COLUMNS]
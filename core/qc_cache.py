@@ -0,0 +1,119 @@
+import hashlib
+import inspect
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from core import helpers, qc_engine
+from core.qc_engine import ISSUE_COLUMNS
+from core.qc_rules import TOOLS, run_tool
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "qc_fingerprints.sqlite")
+
+
+def ruleset_version(tool) -> str:
+    """Hash of the rule engine, its helpers and the tool's rule module; any edit to one invalidates the cache."""
+    h = hashlib.sha1(pd.__version__.encode())
+    for module in (qc_engine, helpers, TOOLS[tool]):
+        h.update(inspect.getsource(module).encode())
+    return h.hexdigest()
+
+
+def row_fingerprints(df: pd.DataFrame, repeats=None) -> pd.Series:
+    """One hash per joined row: every column (QC_Log fields included) plus its repeat-group children."""
+    df = df.reset_index(drop=True)
+    cols = sorted(df.columns)
+    columns_hash = int(hashlib.sha1("|".join(cols).encode()).hexdigest()[:16], 16)
+    parts = {"_columns": pd.Series(columns_hash, index=df.index, dtype="uint64")}
+    parts["_row"] = pd.util.hash_pandas_object(df[cols].astype(str), index=False)
+    keys = df["KEY"].astype(str).str.strip()
+    for group, child in sorted((repeats or {}).items()):
+        child = child.reset_index(drop=True)
+        child_hash = pd.util.hash_pandas_object(child[sorted(child.columns)].astype(str), index=False)
+        per_parent = child_hash.groupby(child["PARENT_KEY"].astype(str).str.strip().values).sum()
+        parts[group] = per_parent.reindex(keys.values, fill_value=0).values
+    return pd.util.hash_pandas_object(pd.DataFrame(parts), index=False).map("{:016x}".format)
+
+
+class FingerprintCache:
+    """SQLite store of each KEY's fingerprint and the issues it produced, per tool and rule-set version."""
+
+    def __init__(self, path=CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        with self._connect() as con:
+            con.execute("CREATE TABLE IF NOT EXISTS fingerprints "
+                        "(tool TEXT, version TEXT, key TEXT, fingerprint TEXT, PRIMARY KEY (tool, key))")
+            con.execute("CREATE TABLE IF NOT EXISTS issues "
+                        "(tool TEXT, key TEXT, position INTEGER, qa_by TEXT, label TEXT, issue TEXT, choice TEXT)")
+            con.execute("CREATE INDEX IF NOT EXISTS issues_tool_key ON issues (tool, key)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path)
+
+    def fingerprints(self, tool, version) -> dict:
+        with self._connect() as con:
+            rows = con.execute("SELECT key, fingerprint FROM fingerprints WHERE tool = ? AND version = ?",
+                               (tool, version)).fetchall()
+        return dict(rows)
+
+    def issues(self, tool, keys) -> pd.DataFrame:
+        with self._connect() as con:
+            con.execute("CREATE TEMP TABLE wanted (key TEXT PRIMARY KEY)")
+            con.executemany("INSERT OR IGNORE INTO wanted VALUES (?)", [(k,) for k in keys])
+            rows = con.execute("SELECT i.key, i.qa_by, i.label, i.issue, i.choice FROM issues i "
+                               "JOIN wanted w ON w.key = i.key WHERE i.tool = ? ORDER BY i.key, i.position",
+                               (tool,)).fetchall()
+        issues = pd.DataFrame(rows, columns=["KEY", "QA_By", "Question_Label", "Issue", "Choice"])
+        issues.insert(1, "Tool", tool)
+        return issues[ISSUE_COLUMNS]
+
+    def store(self, tool, version, fingerprints: dict, issues: pd.DataFrame):
+        """Replace the cached entry of every KEY in `fingerprints` (KEYs without issues included).
+
+        Entries of the tool under any other rule-set version are dropped, issues included.
+        """
+        keys = [(tool, k) for k in fingerprints]
+        issues = issues.assign(position=issues.groupby("KEY").cumcount())
+        with self._connect() as con:
+            con.execute("DELETE FROM fingerprints WHERE tool = ? AND version != ?", (tool, version))
+            con.execute("DELETE FROM issues WHERE tool = ? AND key NOT IN "
+                        "(SELECT key FROM fingerprints WHERE tool = ?)", (tool, tool))
+            con.executemany("DELETE FROM issues WHERE tool = ? AND key = ?", keys)
+            con.executemany("INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?)",
+                            [(tool, version, k, fp) for k, fp in fingerprints.items()])
+            con.executemany("INSERT INTO issues VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            [(tool, r.KEY, r.position, r.QA_By, r.Question_Label, r.Issue, r.Choice)
+                             for r in issues.itertuples(index=False)])
+
+
+def run_incremental(tool, df, repeats=None, workers=1, cache=None, profile=None):
+    """run_tool that only re-checks new or edited submissions.
+
+    A row is reused when its KEY is unique in the export and its fingerprint (see
+    row_fingerprints) matches the one cached under the current rule-set version.
+    Returns (issues, reused_count); issues keep the export's row order. `profile` is
+    passed to run_tool and so only covers the rows actually re-checked.
+    """
+    cache = cache or FingerprintCache()
+    version = ruleset_version(tool)
+    df = df.reset_index(drop=True)
+    keys = df["KEY"].astype(str).str.strip()
+    fps = row_fingerprints(df, repeats)
+
+    cached = cache.fingerprints(tool, version)
+    unique = ~keys.duplicated(keep=False)
+    hit = unique & (keys.map(cached) == fps)
+
+    checked = run_tool(tool, df[~hit], repeats, workers=workers, profile=profile)
+    reused = cache.issues(tool, keys[hit].tolist())
+    fresh = unique & ~hit
+    cache.store(tool, version, dict(zip(keys[fresh], fps[fresh])), checked[checked["KEY"].isin(set(keys[fresh]))])
+
+    # back into export order: by the first row of each KEY, cached rows first on ties
+    order = pd.Series(np.arange(len(df)), index=keys).groupby(level=0).min()
+    issues = pd.concat([reused, checked], ignore_index=True)
+    issues = issues.iloc[np.argsort(issues["KEY"].map(order).values, kind="stable")]
+    return issues.reset_index(drop=True), int(hit.sum())
@@ -0,0 +1,286 @@
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Union
+
+import numpy as np
+import pandas as pd
+
+from core.helpers import choice_index, contains_perso_arabic
+
+ISSUE_COLUMNS = ["KEY", "Tool", "QA_By", "Question_Label", "Issue", "Choice"]
+
+PROFILE_COLUMNS = ["Tool", "Rule", "Question_Label", "Rows", "Issues", "Seconds"]
+
+PHOTO_QA_CHOICES = ["Blur/Not Visible Photo", "Relevant Photo", "Irrelevant Photo"]
+
+
+class QCFrame:
+    """Column-level view of one joined tool export, shared by every rule of a run.
+
+    Columns are read as stripped text ("" when the column is missing) and cached, so
+    each column is normalized once per run no matter how many rules read it.
+
+    `repeats` holds the repeat-group sheets of the workbook by sheet name (see
+    core.helpers.read_tool_workbook). A frame returned by `repeat()` has one row per
+    child record, with `parent` set to the frame it came from and `parent_rows` the
+    position of each child's parent row.
+    """
+
+    def __init__(self, df: pd.DataFrame, repeats=None, parent=None, parent_rows=None):
+        self.df = df
+        self.index = df.index
+        self.repeats = repeats or {}
+        self.parent = parent
+        self.parent_rows = parent_rows
+        self._cache = {}
+
+    def __len__(self):
+        return len(self.df)
+
+    def _cached(self, key, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def col(self, name) -> pd.Series:
+        def build():
+            if name not in self.df.columns:
+                return pd.Series("", index=self.index, dtype=object)
+            return self.df[name].fillna("").astype(str).str.strip()
+        return self._cached(("col", name), build)
+
+    def upper(self, name) -> pd.Series:
+        return self._cached(("upper", name), lambda: self.col(name).str.upper())
+
+    def blank(self, name) -> pd.Series:
+        return self.col(name) == ""
+
+    def filled(self, name) -> pd.Series:
+        return self.col(name) != ""
+
+    def eq(self, name, value) -> pd.Series:
+        return self.col(name) == value
+
+    def isin(self, name, values) -> pd.Series:
+        return self.col(name).isin(values)
+
+    def is_digit(self, name) -> pd.Series:
+        return self._cached(("digit", name), lambda: self.col(name).str.isdigit())
+
+    def number(self, name) -> pd.Series:
+        """Numeric value of a column, NaN where it does not parse."""
+        return self._cached(("number", name), lambda: pd.to_numeric(self.col(name), errors="coerce").astype(float))
+
+    def integer(self, name) -> pd.Series:
+        """Integer value of a column, NaN where int() would fail."""
+        def build():
+            s = self.col(name)
+            return pd.to_numeric(s.where(s.str.fullmatch(r"[+-]?\d+"), None), errors="coerce")
+        return self._cached(("integer", name), build)
+
+    def perso_arabic(self, name) -> pd.Series:
+        """"Contains Dari/Pashto" mask, computed once per column for the whole run."""
+        return self._cached(("perso_arabic", name), lambda: contains_perso_arabic(self.col(name)))
+
+    def english(self, name) -> pd.Series:
+        """Not blank and no Persian/Dari, Pashto or Arabic letters."""
+        return self._cached(("english", name), lambda: self.filled(name) & ~self.perso_arabic(name))
+
+    def not_english(self, name) -> pd.Series:
+        return ~self.english(name)
+
+    def ascii(self, name) -> pd.Series:
+        return self._cached(("ascii", name), lambda: self.col(name).map(str.isascii).astype(bool))
+
+    def choices(self, name) -> pd.DataFrame:
+        """(row, choice code) membership of a select_multiple column, built once per run."""
+        return self._cached(("choices", name), lambda: choice_index(self.col(name)))
+
+    def includes(self, name, code) -> pd.Series:
+        """True where the select_multiple answer has `code` among its choices."""
+        index = self.choices(name)
+        if code not in index.columns:
+            return pd.Series(False, index=self.index)
+        return index[code]
+
+    def choice_count(self, name) -> pd.Series:
+        return self._cached(("choice_count", name), lambda: self.choices(name).sum(axis=1).astype(int))
+
+    def outside(self, name, allowed) -> pd.Series:
+        """True where any selected choice is not in `allowed`."""
+        index = self.choices(name)
+        return index.drop(columns=[c for c in index.columns if c in set(allowed)]).any(axis=1)
+
+    def join(self, *names, sep="/") -> pd.Series:
+        out = self.col(names[0])
+        for name in names[1:]:
+            out = out + sep + self.col(name)
+        return out
+
+    def memo(self, fn) -> pd.Series:
+        """Evaluate a mask function once per run (used for rule scopes)."""
+        return self._cached(("memo", fn), lambda: fn(self))
+
+    def repeat(self, group) -> "QCFrame":
+        """Child records of repeat group `group`, matched to this frame's rows on PARENT_KEY.
+
+        One hash join for the whole sheet; children whose parent is not in this frame
+        are dropped, and a parent KEY that appears twice gets its children twice.
+        """
+        def build():
+            child = self.repeats.get(group)
+            if child is None or "PARENT_KEY" not in child.columns:
+                child = pd.DataFrame(columns=["PARENT_KEY"])
+            child = child.assign(PARENT_KEY=child["PARENT_KEY"].fillna("").astype(str).str.strip())
+            parents = pd.DataFrame({"PARENT_KEY": self.col("KEY"), "_parent_row": np.arange(len(self))})
+            joined = child.merge(parents, on="PARENT_KEY", how="inner")
+            rows = joined.pop("_parent_row").to_numpy()
+            return QCFrame(joined.reset_index(drop=True), self.repeats, parent=self, parent_rows=rows)
+        return self._cached(("repeat", group), build)
+
+    def repeat_count(self, group) -> pd.Series:
+        """Number of `group` child records per row."""
+        def build():
+            rows = self.repeat(group).parent_rows
+            return pd.Series(np.bincount(rows, minlength=len(self)), index=self.index)
+        return self._cached(("repeat_count", group), build)
+
+    def up(self, values) -> pd.Series:
+        """Broadcast a parent-row series (e.g. a parent mask) onto this frame's child rows."""
+        return pd.Series(np.asarray(values)[self.parent_rows], index=self.index)
+
+
+Mask = Callable[[QCFrame], pd.Series]
+Value = Union[str, Callable[[QCFrame], pd.Series]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One QC check, raised for every row where `when` is True.
+
+    `label` is the Question_Label, `message` the Issue text (or a function of the
+    frame for per-row text) and `choice` the column holding the offending value (or a
+    function of the frame, or None for no value). With `repeat` set, the rule is
+    evaluated on the child records of that repeat group (QCFrame.repeat) and raised
+    against the parent KEY.
+    """
+    label: str
+    message: Value
+    choice: Value
+    when: Mask
+    repeat: str = None
+
+
+def scoped(scope: Mask, rules) -> list:
+    """Restrict rules to the rows selected by `scope` (e.g. consent given)."""
+    def when(q, r):
+        if r.repeat:
+            return q.up(q.parent.memo(scope)) & r.when(q)
+        return q.memo(scope) & r.when(q)
+    return [replace(r, when=lambda q, r=r: when(q, r)) for r in rules]
+
+
+def _values(q: QCFrame, value: Value, rows, column: bool):
+    if value is None:
+        return ""
+    if callable(value):
+        return np.asarray(value(q).astype(str))[rows]
+    if column:
+        return np.asarray(q.col(value))[rows]
+    return value
+
+
+def run_rules(df: pd.DataFrame, rules, tool: str, repeats=None, profile=None) -> pd.DataFrame:
+    """Evaluate rules over a joined export (see core.helpers.join_qc_log).
+
+    `repeats` are the workbook's repeat-group sheets, needed by rules with `repeat`
+    set. Returns the issues table in the same order as a row-by-row scan: by row, then
+    by rule order, then by child record.
+
+    When `profile` is a list, one record per rule (PROFILE_COLUMNS) is appended to it.
+    Columns are normalized on first use, so that cost lands on the first rule reading them.
+    """
+    q = QCFrame(df.reset_index(drop=True), repeats)
+    keys = np.asarray(q.col("KEY"))
+    qa_by = np.asarray(q.col("QC_By"))
+
+    frames = []
+    for order, rule in enumerate(rules):
+        started = time.perf_counter()
+        frame = q.repeat(rule.repeat) if rule.repeat else q
+        mask = np.asarray(rule.when(frame), dtype=bool)
+        rows = np.flatnonzero(mask)
+        if profile is not None:
+            profile.append({"Tool": tool, "Rule": order, "Question_Label": rule.label, "Rows": len(frame),
+                            "Issues": len(rows), "Seconds": time.perf_counter() - started})
+        if len(rows) == 0:
+            continue
+        parent_rows = frame.parent_rows[rows] if rule.repeat else rows
+        frames.append(pd.DataFrame({
+            "_row": parent_rows,
+            "_rule": order,
+            "_child": rows if rule.repeat else 0,
+            "KEY": keys[parent_rows],
+            "Tool": tool,
+            "QA_By": qa_by[parent_rows],
+            "Question_Label": rule.label,
+            "Issue": _values(frame, rule.message, rows, column=False),
+            "Choice": _values(frame, rule.choice, rows, column=True),
+        }))
+
+    if not frames:
+        return pd.DataFrame(columns=ISSUE_COLUMNS)
+    issues = pd.concat(frames, ignore_index=True).sort_values(["_row", "_rule", "_child"], kind="stable")
+    return issues[ISSUE_COLUMNS].astype(str).reset_index(drop=True)
+
+
+def profile_table(profile) -> pd.DataFrame:
+    """Per-rule totals of the records collected by run_rules, slowest first."""
+    df = pd.DataFrame(profile, columns=PROFILE_COLUMNS)
+    df = df.groupby(["Tool", "Rule", "Question_Label"], as_index=False)[["Rows", "Issues", "Seconds"]].sum()
+    return df.sort_values("Seconds", ascending=False, kind="stable").reset_index(drop=True)
+
+
+# Rule builders for the patterns the tool rule sets repeat
+
+def other_specify(parent, other, message, code="8888"):
+    """`other` must be filled and in English when `parent` includes `code`."""
+    return Rule(other, message, other, lambda q: q.includes(parent, code) & q.not_english(other))
+
+
+def photo_qa(photo, qa, message):
+    """When `photo` is attached, `qa` must be one of the photo QA choices."""
+    return Rule(qa, message, qa, lambda q: q.filled(photo) & ~q.isin(qa, PHOTO_QA_CHOICES))
+
+
+def translated(source, target, message):
+    """When `source` has text, `target` must be an English translation (not '-')."""
+    return Rule(target, message, target, lambda q: q.filled(source) & (q.not_english(target) | q.eq(target, "-")))
+
+
+def repeat_count_matches(count, group):
+    """A numeric `count` answer must equal the number of `group` child records."""
+    return Rule(count,
+                lambda q: ("Expected " + q.integer(count).fillna(0).astype("int64").astype(str) + " records in " + group
+                           + " (PARENT_KEY==" + q.col("KEY") + ") but found " + q.repeat_count(group).astype(str) + "."),
+                count,
+                lambda q: q.is_digit(count) & (q.integer(count) != q.repeat_count(group)))
+
+
+def qa_status_rules():
+    """QA_status / review_status consistency checks shared by Tool 7 and Tool 10."""
+    reviewed = lambda q: q.upper("review_status").isin(["APPROVED", "REJECTED"])
+    return [
+        Rule("QA_status", "QA_status must be APP or REJ only.", lambda q: q.upper("QA_status"),
+             lambda q: ~q.upper("QA_status").isin(["", "APP", "REJ"])),
+        Rule("review_status", "If QA_status is APP, review_status must be APPROVED.", lambda q: q.upper("review_status"),
+             lambda q: (q.upper("QA_status") == "APP") & (q.upper("review_status") != "APPROVED")),
+        Rule("review_status", "If QA_status is REJ, review_status must be REJECTED.", lambda q: q.upper("review_status"),
+             lambda q: (q.upper("QA_status") == "REJ") & (q.upper("review_status") != "REJECTED")),
+        Rule("QA_status", "If review_status is APPROVED/REJECTED, QA_status cannot be blank.",
+             lambda q: q.upper("QA_status"),
+             lambda q: reviewed(q) & q.upper("QA_status").isin(["", "-"])),
+        Rule("QA_By/QA_status", "QA_By or QA_status cannot be '-' when review_status is APPROVED/REJECTED.",
+             lambda q: q.col("QC_By") + "/" + q.upper("QA_status"),
+             lambda q: (q.eq("QC_By", "-") | (q.upper("QA_status") == "-")) & reviewed(q)),
+    ]
@@ -0,0 +1,51 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from core.qc_engine import ISSUE_COLUMNS, run_rules
+from core.qc_rules import tool1, tool7, tool10
+
+# Rule sets by tool name; each module exposes TOOL, STATUS_COLUMN and RULES
+TOOLS = {m.TOOL: m for m in (tool1, tool7, tool10)}
+
+# Below this many rows per worker, starting a process costs more than it saves
+MIN_ROWS_PER_WORKER = 2000
+
+
+def _run_chunk(tool, df, repeats, profiled):
+    m = TOOLS[tool]
+    profile = [] if profiled else None
+    return run_rules(df, m.RULES, m.TOOL, repeats=repeats, profile=profile), profile
+
+
+def _chunk_repeats(repeats, keys):
+    """Only the child records whose parent is in this chunk, so workers get less to unpickle."""
+    return {g: r[r["PARENT_KEY"].astype(str).str.strip().isin(keys)] for g, r in (repeats or {}).items()}
+
+
+def run_tool(tool, df, repeats=None, workers=1, profile=None):
+    """Run a tool's rule set over a joined export, optionally across a process pool.
+
+    `workers=None` uses every core. Rows are split into contiguous chunks and the
+    issue tables are concatenated in chunk order, so the result is the same as a
+    single run_rules call. Rules are lambdas and can't be pickled, so each worker looks
+    its rule set up by tool name. `profile` collects per-rule records as in run_rules
+    (one set per chunk; see qc_engine.profile_table).
+    """
+    m = TOOLS[tool]
+    df = df.reset_index(drop=True)
+    workers = min(workers or os.cpu_count() or 1, len(df) // MIN_ROWS_PER_WORKER)
+    if workers <= 1:
+        return run_rules(df, m.RULES, m.TOOL, repeats=repeats, profile=profile)
+
+    bounds = np.linspace(0, len(df), workers + 1).astype(int)
+    chunks = [df.iloc[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+    chunk_repeats = [_chunk_repeats(repeats, set(c["KEY"].astype(str).str.strip())) for c in chunks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_run_chunk, [tool] * workers, chunks, chunk_repeats, [profile is not None] * workers))
+    if profile is not None:
+        for _, records in parts:
+            profile.extend(records)
+    return pd.concat([issues for issues, _ in parts], ignore_index=True)[ISSUE_COLUMNS]
@@ -0,0 +1,542 @@
+from core.qc_engine import PHOTO_QA_CHOICES, Rule, other_specify, photo_qa, repeat_count_matches, scoped, translated
+
+TOOL = "Tool 1"
+# Tool 1 takes the approval from the export itself, not from QC_Log
+STATUS_COLUMN = "review_status"
+
+NO_ANSWER = ["0", "9999", "7777"]
+PHONE_RE = r"07\d{8}|0000000000"
+
+
+def consent_declined(q):
+    return q.eq("Consent_Informed", "0")
+
+
+def consent_given(q):
+    return ~q.eq("Consent_Informed", "0")
+
+
+def _linked_to_hub(q):
+    return q.includes("linked_to_hub_school", "1")
+
+
+def _emis_pipe_without_parts(q):
+    emis = q.col("linked_hub_school_EMIS_ID")
+    return emis.str.contains("|", regex=False) & (emis.str.replace(r"[|\s]", "", regex=True) == "")
+
+
+def _emis_invalid(q):
+    emis = q.col("linked_hub_school_EMIS_ID")
+    return (~emis.isin(["", "-"]) & ~emis.str.contains("|", regex=False)
+            & (emis.str.lower() != "not found") & ~q.is_digit("linked_hub_school_EMIS_ID"))
+
+
+def _distance_out_of_range(q):
+    distance = q.number("distance_to_hub_school_km")
+    return q.eq("linked_to_hub_school", "1") & ((distance < 1) | (distance > 20))
+
+
+def _distance_not_numeric(q):
+    return (q.eq("linked_to_hub_school", "1") & q.filled("distance_to_hub_school_km")
+            & q.number("distance_to_hub_school_km").isna())
+
+
+def _no_disabled_counts(q, name):
+    return ~q.is_digit(name) | (q.number(name) == 0)
+
+
+DECLINED_RULES = [
+    Rule("Final_comments_Translation",
+         "When Consent=0 and Final_comments is filled, Final_comments_Translation must not be blank or '-'. Translate the final comment to English.",
+         "Final_comments_Translation",
+         lambda q: q.filled("Final_comments") & q.isin("Final_comments_Translation", ["", "-"])),
+    Rule("Remark",
+         "When Consent=0, QC_Log Remark must be present and in English explaining why consent was not taken.",
+         "QC_Remark",
+         lambda q: q.not_english("QC_Remark")),
+]
+
+CONSENTED_RULES = [
+    Rule("Final_comments_Translation", "Final comment must be translated when form is approved.",
+         "Final_comments_Translation",
+         lambda q: q.filled("Final_comments") & q.isin("Final_comments_Translation", ["", "-"])),
+    Rule("QA_status", "If review_status=APPROVED, QA_status must be APP.",
+         lambda q: q.upper("QA_status"),
+         lambda q: q.upper("QA_status") != "APP"),
+    Rule("Resp_name", "Resp_name must not be blank and must not contain Persian/Dari or Pashto letters.",
+         "Resp_name",
+         lambda q: q.not_english("Resp_name")),
+    Rule("Resp_title/Remark", "When Resp_title=2, QC_Log Remark must not be blank or non-English.",
+         "QC_Remark",
+         lambda q: q.eq("Resp_title", "2") & q.not_english("QC_Remark")),
+    Rule("Resp_phone", "Phone must start with 07 and be 10 digits, or be 0000000000.",
+         "Resp_phone",
+         lambda q: ~q.col("Resp_phone").str.fullmatch(PHONE_RE)),
+    other_specify("Resp_communities", "Resp_communities_IP_other",
+                  "When Resp_communities includes '8888', Resp_communities_IP_other must not be blank and must be in English."),
+    Rule("CBE_date_establishment", "CBE establishment date must not be in 2024 or 2025.",
+         "CBE_date_establishment",
+         lambda q: q.col("CBE_date_establishment").str.startswith(("2025", "2024"))),
+    other_specify("cbe_closure_reason", "cbe_closure_reason_other",
+                  "When cbe_closure_reason=8888, cbe_closure_reason_other must not be blank and must not contain Persian or Pashto letters."),
+    other_specify("cbe_closure_boys_schooling", "cbe_closure_boys_schooling_other",
+                  "When cbe_closure_boys_schooling=8888, cbe_closure_boys_schooling_other must not be blank and must be in English."),
+    other_specify("cbe_closure_girls_schooling", "cbe_closure_girls_schooling_other",
+                  "When cbe_closure_girls_schooling=8888, cbe_closure_girls_schooling_other must not be blank and must be in English."),
+    Rule("cbe_location_type",
+         "cbe_location_type=8888. Please review the form and select the correct choice from the codebook.",
+         "cbe_location_type",
+         lambda q: q.eq("cbe_location_type", "8888")),
+    Rule("cbe_location_type_other", "cbe_location_type_other must be blank unless cbe_location_type includes '8888'.",
+         "cbe_location_type_other",
+         lambda q: ~q.includes("cbe_location_type", "8888") & q.filled("cbe_location_type_other")),
+    Rule("Instruction_Language",
+         "Instruction_Language must not contain '8888'. Choose the correct language code (Pashto or Dari).",
+         "Instruction_Language",
+         lambda q: q.includes("Instruction_Language", "8888")),
+    Rule("Instruction_Language_Other",
+         "Instruction_Language_Other must be blank when Instruction_Language does not include '8888'.",
+         "Instruction_Language_Other",
+         lambda q: ~q.includes("Instruction_Language", "8888") & q.filled("Instruction_Language_Other")),
+    Rule("alc_level", "When cbe_type is 2 or 3, alc_level must not be blank and must be a single digit.",
+         "alc_level",
+         lambda q: q.isin("cbe_type", ["2", "3"]) & q.blank("alc_level")),
+    Rule("alc_level", "alc_level must be a single digit number when required.",
+         "alc_level",
+         lambda q: (q.isin("cbe_type", ["2", "3"]) & q.filled("alc_level")
+                    & ~(q.is_digit("alc_level") & (q.col("alc_level").str.len() == 1)))),
+    Rule("is_islamic_center",
+         "is_islamic_center includes '1'. This is a sensitive question — review carefully and follow up with respondent.",
+         "is_islamic_center",
+         lambda q: q.includes("is_islamic_center", "1")),
+    *[Rule(f, f"When is_islamic_center=0, '{f}' must be blank.", f,
+           lambda q, f=f: q.eq("is_islamic_center", "0") & q.filled(f))
+      for f in ["islamic_center_type", "islamic_center_type_other"]],
+    Rule("linked_hub_school_name",
+         "If linked_to_hub_school=1, linked_hub_school_name must not be blank and must not contain Persian/Dari or Pashto letters.",
+         "linked_hub_school_name",
+         lambda q: _linked_to_hub(q) & q.not_english("linked_hub_school_name")),
+    Rule("linked_hub_school_TPM_ID", "linked_hub_school_TPM_ID must contain only '-' when applicable.",
+         "linked_hub_school_TPM_ID",
+         lambda q: q.filled("linked_hub_school_TPM_ID") & ~q.eq("linked_hub_school_TPM_ID", "-")),
+    Rule("linked_hub_school_EMIS_ID",
+         "When linked_to_hub_school=1, linked_hub_school_EMIS_ID must not be '-' or blank. It should be numeric, 'Not found', or two values separated by '|'.",
+         "linked_hub_school_EMIS_ID",
+         lambda q: _linked_to_hub(q) & q.isin("linked_hub_school_EMIS_ID", ["-", ""])),
+    Rule("linked_hub_school_EMIS_ID", "linked_hub_school_EMIS_ID has '|' but no valid parts.",
+         "linked_hub_school_EMIS_ID",
+         lambda q: _linked_to_hub(q) & _emis_pipe_without_parts(q)),
+    Rule("linked_hub_school_EMIS_ID",
+         "linked_hub_school_EMIS_ID must be numeric, 'Not found', or values separated by '|'. Please correct EMIS ID.",
+         "linked_hub_school_EMIS_ID",
+         lambda q: _linked_to_hub(q) & _emis_invalid(q)),
+    Rule("distance_to_hub_school_km",
+         "When linked_to_hub_school = 1, distance_to_hub_school_km must not be blank.",
+         "distance_to_hub_school_km",
+         lambda q: q.eq("linked_to_hub_school", "1") & q.blank("distance_to_hub_school_km")),
+    Rule("distance_to_hub_school_km",
+         lambda q: ("When linked_to_hub_school = 1, distance_to_hub_school_km must be between 1 and 20 (found "
+                    + q.number("distance_to_hub_school_km").astype(str) + ")."),
+         lambda q: q.number("distance_to_hub_school_km"),
+         _distance_out_of_range),
+    Rule("distance_to_hub_school_km", "distance_to_hub_school_km must be numeric when linked_to_hub_school = 1.",
+         "distance_to_hub_school_km",
+         _distance_not_numeric),
+    Rule("num_male_teachers_teaching/num_female_teachers_teaching",
+         "Review form again: It is impossible for class to have neither male nor female teachers.",
+         lambda q: q.join("num_male_teachers_teaching", "num_female_teachers_teaching"),
+         lambda q: q.eq("num_male_teachers_teaching", "0") & q.eq("num_female_teachers_teaching", "0")),
+    *[Rule(f, "Review form again: Number of teachers exceeds the allowed limit.", f,
+           lambda q, f=f: q.is_digit(f) & (q.number(f) > 3))
+      for f in ["num_total_teachers_teaching", "num_total_teachers_present"]],
+    Rule("registered_students_with_disability",
+         "Review form again: If no disabled students, counts must be 0 and disability_type must be blank.",
+         lambda q: q.join("registered_boys_with_disability", "registered_girls_with_disability", "disability_type"),
+         lambda q: q.eq("registered_students_with_disability", "0") & (
+             ~q.eq("registered_boys_with_disability", "0") | ~q.eq("registered_girls_with_disability", "0")
+             | q.filled("disability_type"))),
+    Rule("registered_students_with_disability",
+         "If disabled students registered, at least one of boys/girls must be > 0.",
+         lambda q: q.join("registered_boys_with_disability", "registered_girls_with_disability"),
+         lambda q: (q.eq("registered_students_with_disability", "1")
+                    & _no_disabled_counts(q, "registered_boys_with_disability")
+                    & _no_disabled_counts(q, "registered_girls_with_disability"))),
+    Rule("disability_type",
+         "If disability_registered=1, disability_type must not be blank and must not contain Persian/Dari or Pashto letters.",
+         "disability_type",
+         lambda q: q.eq("disability_registered", "1") & q.not_english("disability_type")),
+    Rule("dropout_reasons", "Review form: dropout_reasons must not be blank when students dropped out > 0.",
+         "dropout_reasons",
+         lambda q: (q.is_digit("registered_students_dropped_out")
+                    & (q.number("registered_students_dropped_out") > 0) & q.blank("dropout_reasons"))),
+    other_specify("dropout_reasons", "dropout_reasons_other",
+                  "If 8888 is selected in dropout_reasons, dropout_reasons_other must not be blank and must not contain Persian/Dari or Pashto letters."),
+    Rule("students_picture_QA",
+         "Value must only be one of: Relevant Photo / Irrelevant Photo / Blur/Not Visible Photo.",
+         "students_picture_QA",
+         lambda q: q.filled("students_picture_QA") & ~q.isin("students_picture_QA", PHOTO_QA_CHOICES)),
+    Rule("reason_absenteeism_audio", "If student absent 10 days=Yes, audio file must be provided.",
+         "reason_absenteeism_audio",
+         lambda q: q.eq("students_absent_10_days", "1") & q.blank("reason_absenteeism_audio")),
+    Rule("reason_absenteeism_translation_QA", "Reason for absenteeism must be translated; cannot be blank or '-'.",
+         "reason_absenteeism_translation_QA",
+         lambda q: q.filled("reason_absenteeism_audio") & q.isin("reason_absenteeism_translation_QA", ["", "-"])),
+    Rule("reason_absenteeism_translation_QA", "Writing 'No comment' is not allowed in absenteeism translation.",
+         "reason_absenteeism_translation_QA",
+         lambda q: q.col("reason_absenteeism_translation_QA").str.lower().str.contains("no comment", regex=False)),
+
+    # Classroom kit
+    Rule("classroom_kit_received_count",
+         "When classroom_kit_received=1, classroom_kit_received_count must not be blank.",
+         "classroom_kit_received_count",
+         lambda q: q.eq("classroom_kit_received", "1") & q.blank("classroom_kit_received_count")),
+    Rule("classroom_kit_received_count",
+         "Each class can only receive a kit once per year. Count cannot be 0 or greater than 3.",
+         "classroom_kit_received_count",
+         lambda q: q.eq("classroom_kit_received_count", "0") | (q.integer("classroom_kit_received_count") > 3)),
+    Rule("classroom_kit_received_frequency_in_alc",
+         "When cbe_type=1 and classroom_kit_received=1, classroom_kit_received_frequency_in_alc must be blank.",
+         "classroom_kit_received_frequency_in_alc",
+         lambda q: (q.eq("cbe_type", "1") & q.eq("classroom_kit_received", "1")
+                    & q.filled("classroom_kit_received_frequency_in_alc"))),
+    Rule("classroom_kit_received_frequency_in_alc",
+         "When cbe_type=2 and classroom_kit_received=1, classroom_kit_received_frequency_in_alc must not be blank.",
+         "classroom_kit_received_frequency_in_alc",
+         lambda q: (q.eq("cbe_type", "2") & q.eq("classroom_kit_received", "1")
+                    & q.blank("classroom_kit_received_frequency_in_alc"))),
+    other_specify("classroom_material_included", "classroom_material_included_other",
+                  "If 'Other (8888)' is selected, classroom_material_included_other must not be blank and must not contain Persian/Dari or Pashto letters."),
+    Rule("classroom_materials_count", "The number of selected materials must equal classroom_materials_count.",
+         "classroom_materials_count",
+         lambda q: (q.filled("classroom_material_included")
+                    & (q.integer("classroom_materials_count") != q.choice_count("classroom_material_included"))
+                    & q.integer("classroom_materials_count").notna())),
+    Rule("classroom_kit_received",
+         "When classroom_kit_received=0, the reasons and expected kit info must not be blank.",
+         "classroom_kit_received",
+         lambda q: q.eq("classroom_kit_received", "0") & (
+             q.blank("classroom_kit_not_received_reason") | q.blank("learning_disruption_tlm_lack")
+             | q.blank("classroom_kit_expected"))),
+    other_specify("classroom_kit_not_received_reason", "classroom_kit_not_received_reason_other",
+                  "If 'Other (8888)' is selected, classroom_kit_not_received_reason_other must not be blank and must not contain Persian/Dari or Pashto letters."),
+    Rule("classroom_kit_in_use_1",
+         "If option 1 is selected in classroom_kit_grouped_photo, classroom_kit_in_use_1 must not be blank.",
+         "classroom_kit_in_use_1",
+         lambda q: q.includes("classroom_kit_grouped_photo", "1") & q.blank("classroom_kit_in_use_1")),
+    *[photo_qa(f"classroom_kit_{f}", f"classroom_kit_{f}_QA",
+               f"If classroom_kit_{f} has value, QA must be one of: Blur/Not Visible Photo, Relevant Photo, Irrelevant Photo.")
+      for f in ["in_use_1", "in_use_2"]],
+    Rule("classroom_kit_not_in_use_1",
+         "If option 2 is selected in classroom_kit_grouped_photo, classroom_kit_not_in_use_1 must not be blank.",
+         "classroom_kit_not_in_use_1",
+         lambda q: q.includes("classroom_kit_grouped_photo", "2") & q.blank("classroom_kit_not_in_use_1")),
+    *[photo_qa(f"classroom_kit_{f}", f"classroom_kit_{f}_QA",
+               f"If classroom_kit_{f} has value, QA must be one of: Blur/Not Visible Photo, Relevant Photo, Irrelevant Photo.")
+      for f in ["not_in_use_1", "not_in_use_2"]],
+    Rule("classroom_kit_grouped_photo", "If option 3 is selected, all in_use/not_in_use fields must be blank.",
+         "classroom_kit_grouped_photo",
+         lambda q: q.includes("classroom_kit_grouped_photo", "3") & (
+             q.filled("classroom_kit_in_use_1") | q.filled("classroom_kit_in_use_2")
+             | q.filled("classroom_kit_not_in_use_1") | q.filled("classroom_kit_not_in_use_2"))),
+    *[Rule(f, "If option 3 is selected, all QA fields must have '-' value.", f,
+           lambda q, f=f: q.includes("classroom_kit_grouped_photo", "3") & ~q.eq(f, "-"))
+      for f in ["classroom_kit_in_use_1_QA", "classroom_kit_in_use_2_QA",
+                "classroom_kit_not_in_use_1_QA", "classroom_kit_not_in_use_2_QA"]],
+    other_specify("classroom_kit_feedback", "classroom_kit_feedback_other",
+                  "If 'Other (8888)' is selected in feedback, classroom_kit_feedback_other must not be blank and must not contain Persian/Dari or Pashto letters."),
+
+    # Teacher kit
+    Rule("teacher_kit_received",
+         "If teacher_kit_received = 1, then related 'not received' questions must be blank.",
+         "teacher_kit_received",
+         lambda q: q.eq("teacher_kit_received", "1") & (
+             q.filled("teacher_kit_not_received_reason") | q.filled("teacher_kit_not_received_reason_other")
+             | q.filled("teacher_kit_expected"))),
+    Rule("teacher_kit_received",
+         "If teacher_kit_received = 1, then count, materials, and grouped photo must not be blank.",
+         "teacher_kit_received",
+         lambda q: q.eq("teacher_kit_received", "1") & (
+             q.blank("teacher_kit_received_count") | q.blank("teacher_material_included")
+             | q.blank("teacher_kit_grouped_photo"))),
+    Rule("teacher_kit_received_count", "Teacher kit must be between 1 and 3 per year.",
+         "teacher_kit_received_count",
+         lambda q: q.is_digit("teacher_kit_received_count") & (
+             (q.number("teacher_kit_received_count") == 0) | (q.number("teacher_kit_received_count") > 3))),
+    other_specify("teacher_material_included", "teacher_material_included_other",
+                  "If 'Other (8888)' is selected, then 'teacher_material_included_other' must not be blank or non-English."),
+    Rule("teacher_materials_count", "Mismatch between teacher_materials_count and number of selected choices.",
+         "teacher_materials_count",
+         lambda q: (q.filled("teacher_material_included") & q.is_digit("teacher_materials_count")
+                    & (q.number("teacher_materials_count") != q.choice_count("teacher_material_included")))),
+    Rule("teacher_kit_in_use_1", "If grouped photo = 1, then teacher_kit_in_use_1 must not be blank.",
+         "teacher_kit_in_use_1",
+         lambda q: q.eq("teacher_kit_grouped_photo", "1") & q.blank("teacher_kit_in_use_1")),
+    *[photo_qa(f"teacher_kit_{f}", f"teacher_kit_{f}_QA", f"Invalid QA choice for teacher_kit_{f}.")
+      for f in ["in_use_1", "in_use_2"]],
+    Rule("teacher_kit_not_in_use_1", "If grouped photo = 2, then teacher_kit_not_in_use_1 must not be blank.",
+         "teacher_kit_not_in_use_1",
+         lambda q: q.eq("teacher_kit_grouped_photo", "2") & q.blank("teacher_kit_not_in_use_1")),
+    *[photo_qa(f"teacher_kit_{f}", f"teacher_kit_{f}_QA", f"Invalid QA choice for teacher_kit_{f}.")
+      for f in ["not_in_use_1", "not_in_use_2"]],
+    other_specify("teacher_kit_feedback", "teacher_kit_feedback_other",
+                  "If 'Other (8888)' is selected in feedback, then 'teacher_kit_feedback_other' must not be blank or non-English."),
+
+    # TLM evidence
+    photo_qa("tlm_receipt_evidence_photo", "tlm_receipt_evidence_photo_QA",
+             "If photo provided, tlm_receipt_evidence_photo_QA must be one of: Blur/Not Visible Photo, Relevant Photo, Irrelevant Photo."),
+    Rule("tlm_stock_evidence_photo", "If tlm_stock_evidence=1, tlm_stock_evidence_photo must not be blank.",
+         "tlm_stock_evidence_photo",
+         lambda q: q.eq("tlm_stock_evidence", "1") & q.blank("tlm_stock_evidence_photo")),
+    photo_qa("tlm_stock_evidence_photo", "tlm_stock_evidence_photo_QA",
+             "If photo provided, tlm_stock_evidence_photo_QA must be valid."),
+
+    # Salary
+    Rule("salary_paid_regularly", "If Resp_title=1, salary_paid_regularly must be answered.",
+         "salary_paid_regularly",
+         lambda q: q.eq("Resp_title", "1") & q.blank("salary_paid_regularly")),
+    Rule("paid_past_two_months", "If salary_paid_regularly answered, paid_past_two_months must not be blank.",
+         "paid_past_two_months",
+         lambda q: q.filled("salary_paid_regularly") & q.blank("paid_past_two_months")),
+    Rule("last_paid_month", "If paid_past_two_months=0, last_paid_month must not be blank.",
+         "last_paid_month",
+         lambda q: q.eq("paid_past_two_months", "0") & q.blank("last_paid_month")),
+    other_specify("last_paid_month", "last_paid_month", "If last_paid_month=8888, it must not be blank or non-English."),
+    Rule("partial_salary_reason", "If salary_payment_type=2 or 3, partial_salary_reason must not be blank.",
+         "partial_salary_reason",
+         lambda q: q.isin("salary_payment_type", ["2", "3"]) & q.blank("partial_salary_reason")),
+
+    # IP and UNICEF support
+    Rule("ip_support_activities", "ip_support_activities must not be blank.", "ip_support_activities",
+         lambda q: q.blank("ip_support_activities")),
+    other_specify("ip_visit_frequency", "ip_visit_frequency_other",
+                  "If 8888 selected, ip_visit_frequency_other must not be blank or non-English."),
+    other_specify("ip_trainings", "ip_trainings_other",
+                  "If 8888 selected, ip_trainings_other must not be blank or non-English."),
+    Rule("ip_training_timing", "If ip_trainings is 0, 9999, or 7777, then ip_training_timing must be blank.",
+         "ip_training_timing",
+         lambda q: q.isin("ip_trainings", NO_ANSWER) & q.filled("ip_training_timing")),
+    Rule("ip_training_timing", "If ip_trainings is not 0/9999/7777, then ip_training_timing must not be blank.",
+         "ip_training_timing",
+         lambda q: ~q.isin("ip_trainings", NO_ANSWER) & q.blank("ip_training_timing")),
+    other_specify("unicef_visit_frequency", "unicef_visit_frequency_other",
+                  "If 8888 selected, unicef_visit_frequency_other must not be blank or non-English."),
+
+    # GRM
+    Rule("has_complaint_box", "If has_complaint_box=1, photo, QA, and visibility must not be blank.",
+         lambda q: q.join("grm_complaint_box_photo", "grm_complaint_box_photo_QA", "grm_complaint_box_visibility",
+                          sep=", "),
+         lambda q: q.eq("has_complaint_box", "1") & (
+             q.blank("grm_complaint_box_photo") | q.blank("grm_complaint_box_photo_QA")
+             | q.blank("grm_complaint_box_visibility"))),
+    photo_qa("grm_complaint_box_photo", "grm_complaint_box_photo_QA",
+             "If photo provided, QA must be one of: Blur/Not Visible Photo, Relevant Photo, Irrelevant Photo."),
+    Rule("no_grm_reason", "When no_grm_available=1, no_grm_reason must not be blank.", "no_grm_reason",
+         lambda q: q.eq("no_grm_available", "1") & q.blank("no_grm_reason")),
+    other_specify("no_grm_reason", "no_grm_reason_other",
+                  "If no_grm_reason includes 8888, no_grm_reason_other must not be blank and must be in English."),
+    Rule("conflict_resolution_methods", "conflict_resolution_methods must not be blank.",
+         "conflict_resolution_methods",
+         lambda q: q.blank("conflict_resolution_methods")),
+    other_specify("conflict_resolution_methods", "conflict_resolution_methods_other",
+                  "If conflict_resolution_methods includes 8888, conflict_resolution_methods_other must not be blank and must be in English."),
+    *[Rule(f, f"{f} must be blank when grm_training_received is 0/9999/7777.", f,
+           lambda q, f=f: q.isin("grm_training_received", NO_ANSWER) & q.filled(f))
+      for f in ["grm_training_topics", "grm_training_timing"]],
+    Rule("no_grm_training_reason", "When grm_training_received=1, no_grm_training_reason must be blank.",
+         "no_grm_training_reason",
+         lambda q: q.eq("grm_training_received", "1") & q.filled("no_grm_training_reason")),
+    other_specify("no_grm_training_reason", "no_grm_training_reason_other",
+                  "If no_grm_training_reason includes 8888, other must not be blank and must be in English."),
+
+    # Complaints
+    *[Rule(f, f"{f} must be blank when complaint_made is 0 or 7777.", f,
+           lambda q, f=f: q.isin("complaint_made", ["0", "7777"]) & q.filled(f))
+      for f in ["complaint_resolved", "complaint_resolution_time", "complaint_resolution_satisfaction",
+                "complaint_resolution_dissatisfaction_reason", "complaint_resolution_dissatisfaction_reason_other"]],
+    Rule("complaint_resolved", "When complaint_made=1, complaint_resolved must not be blank.", "complaint_resolved",
+         lambda q: q.eq("complaint_made", "1") & q.blank("complaint_resolved")),
+    *[Rule(f, f"{f} must not be blank when complaint_resolved=1.", f,
+           lambda q, f=f: q.eq("complaint_resolved", "1") & q.blank(f))
+      for f in ["complaint_resolution_time", "complaint_resolution_satisfaction"]],
+    Rule("complaint_resolution_dissatisfaction_reason",
+         "When complaint_resolution_satisfaction=0, complaint_resolution_dissatisfaction_reason must not be blank.",
+         "complaint_resolution_dissatisfaction_reason",
+         lambda q: (q.eq("complaint_resolution_satisfaction", "0")
+                    & q.blank("complaint_resolution_dissatisfaction_reason"))),
+    other_specify("complaint_resolution_dissatisfaction_reason", "complaint_resolution_dissatisfaction_reason_other",
+                  "If complaint_resolution_dissatisfaction_reason includes 8888, other must not be blank and must be in English."),
+
+    # Code of conduct
+    Rule("coc_signed", "When coc_awareness=1, coc_signed must not be blank.", "coc_signed",
+         lambda q: q.eq("coc_awareness", "1") & q.blank("coc_signed")),
+    Rule("coc_signed", "If coc_awareness = 1, then coc_signed must not be blank.", "coc_signed",
+         lambda q: q.includes("coc_awareness", "1") & q.blank("coc_signed")),
+    Rule("coc_training_timing", "If coc_training = 0, then coc_training_timing must be blank.", "coc_training_timing",
+         lambda q: q.includes("coc_training", "0") & q.filled("coc_training_timing")),
+    Rule("coc_signed_timing", "If coc_signed = 1, then coc_signed_timing must not be blank.", "coc_signed_timing",
+         lambda q: q.includes("coc_signed", "1") & q.blank("coc_signed_timing")),
+    Rule("coc_training_timing", "If coc_training = 1, then coc_training_timing must not be blank.",
+         "coc_training_timing",
+         lambda q: q.includes("coc_training", "1") & q.blank("coc_training_timing")),
+    Rule("coc_principles", "coc_principles must be blank when coc_awareness is 0 or 7777.", "coc_principles",
+         lambda q: q.isin("coc_awareness", ["0", "7777"]) & q.filled("coc_principles")),
+    Rule("coc_principles_count",
+         "coc_principles_count must equal the number of selected choices in coc_principles.",
+         "coc_principles_count",
+         lambda q: (q.includes("coc_principles", "1") & q.integer("coc_principles_count").notna()
+                    & (q.integer("coc_principles_count") != q.choice_count("coc_principles")))),
+    Rule("coc_principles_count", "coc_principles_count check failed (non-numeric or parsing error).",
+         "coc_principles_count",
+         lambda q: (q.includes("coc_principles", "1") & q.filled("coc_principles_count")
+                    & q.integer("coc_principles_count").isna())),
+
+    # GBV hotline
+    Rule("gbv_hotline_visible", "gbv_hotline_visible must not be blank.", "gbv_hotline_visible",
+         lambda q: q.blank("gbv_hotline_visible")),
+    Rule("gbv_hotline_photo", "When gbv_hotline_visible=0, gbv_hotline_photo must be blank.", "gbv_hotline_photo",
+         lambda q: q.eq("gbv_hotline_visible", "0") & q.filled("gbv_hotline_photo")),
+    Rule("gbv_hotline_photo_QA", "When gbv_hotline_visible=0, gbv_hotline_photo_QA must be blank or '-'.",
+         "gbv_hotline_photo_QA",
+         lambda q: q.eq("gbv_hotline_visible", "0") & ~q.isin("gbv_hotline_photo_QA", ["", "-"])),
+    Rule("gbv_hotline_photo", "When gbv_hotline_visible=1, gbv_hotline_photo must not be blank.", "gbv_hotline_photo",
+         lambda q: q.eq("gbv_hotline_visible", "1") & q.blank("gbv_hotline_photo")),
+    Rule("gbv_hotline_photo_QA", "If gbv_hotline_photo provided, gbv_hotline_photo_QA must not be blank or '-'.",
+         "gbv_hotline_photo_QA",
+         lambda q: (q.filled("gbv_hotline_visible") & q.filled("gbv_hotline_photo")
+                    & q.isin("gbv_hotline_photo_QA", ["", "-"]))),
+    Rule("gbv_hotline_photo_QA", "gbv_hotline_photo_QA must be one of the allowed photo QA choices.",
+         "gbv_hotline_photo_QA",
+         lambda q: (q.filled("gbv_hotline_visible") & q.filled("gbv_hotline_photo")
+                    & ~q.isin("gbv_hotline_photo_QA", ["", "-", *PHOTO_QA_CHOICES]))),
+
+    # Textbooks and curriculum
+    *[Rule(f, "If grade_appropriate_textbooks=0 (No, none of them), this question must be blank.", f,
+           lambda q, f=f: q.eq("grade_appropriate_textbooks", "0") & q.filled(f))
+      for f in ["language_appropriate_textbooks", "latest_version_textbooks", "same_version_textbooks"]],
+    Rule("latest_version_textbooks", "latest_version_textbooks must only be 0, 1, 2 or blank (check codebook).",
+         "latest_version_textbooks",
+         lambda q: ~q.isin("latest_version_textbooks", ["", "0", "1", "2"])),
+    Rule("same_version_textbooks", "same_version_textbooks cannot be blank when grade_appropriate_textbooks is 1 or 2.",
+         "same_version_textbooks",
+         lambda q: q.isin("grade_appropriate_textbooks", ["1", "2"]) & q.blank("same_version_textbooks")),
+    Rule("curriculum_has_changed", "curriculum_has_changed must be 0,1,9999,7777 or blank (check codebook).",
+         "curriculum_has_changed",
+         lambda q: ~q.isin("curriculum_has_changed", ["", "0", "1", "9999", "7777"])),
+    Rule("curriculum_change_types", "If curriculum_has_changed=1, curriculum_change_types must not be blank.",
+         "curriculum_change_types",
+         lambda q: q.eq("curriculum_has_changed", "1") & (q.choice_count("curriculum_change_types") == 0)),
+    Rule("curriculum_change_types",
+         "curriculum_change_types contains values outside allowed set (1,2,3,9999,8888).",
+         "curriculum_change_types",
+         lambda q: (q.eq("curriculum_has_changed", "1")
+                    & q.outside("curriculum_change_types", ["1", "2", "3", "9999", "8888"]))),
+    other_specify("curriculum_change_types", "curriculum_change_types_other",
+                  "If curriculum_change_types includes 8888, curriculum_change_types_other must be English and not blank."),
+    Rule("curriculum_change_types_other",
+         "curriculum_change_types_other must be blank unless 8888 is selected in curriculum_change_types.",
+         "curriculum_change_types_other",
+         lambda q: ~q.includes("curriculum_change_types", "8888") & q.filled("curriculum_change_types_other")),
+    Rule("removed_subjects", "removed_subjects cannot be blank if curriculum_change_types includes 1.",
+         "removed_subjects",
+         lambda q: q.includes("curriculum_change_types", "1") & q.blank("removed_subjects")),
+    *[Rule(f, f"{f} cannot be blank if curriculum_change_types includes 2.", f,
+           lambda q, f=f: q.includes("curriculum_change_types", "2") & q.blank(f))
+      for f in ["added_subjects_count", "added_subjects_known", "added_subjects_repeat_count"]],
+    Rule("modified_subjects_known", "modified_subjects_known cannot be blank if curriculum_change_types includes 3.",
+         "modified_subjects_known",
+         lambda q: q.includes("curriculum_change_types", "3") & q.blank("modified_subjects_known")),
+    Rule("modified_subjects_explanation",
+         "If modified_subjects_known=1, modified_subjects_explanation must not be blank.",
+         "modified_subjects_explanation",
+         lambda q: q.eq("modified_subjects_known", "1") & q.blank("modified_subjects_explanation")),
+    Rule("modified_subjects_explanation_QA",
+         "If modified_subjects_explanation has value, modified_subjects_explanation_QA must not be blank or '-'.",
+         "modified_subjects_explanation_QA",
+         lambda q: q.filled("modified_subjects_explanation") & q.isin("modified_subjects_explanation_QA", ["", "-"])),
+    Rule("more_changes", "If curriculum_has_changed is 0 or 9999, more_changes must not be blank.", "more_changes",
+         lambda q: q.eq("curriculum_has_changed", "1") & q.blank("more_changes")),
+    Rule("more_changes_details", "If more_changes includes 1, more_changes_details cannot be blank.",
+         "more_changes_details",
+         lambda q: q.includes("more_changes", "1") & q.blank("more_changes_details")),
+    other_specify("more_changes_details", "more_changes_details_other",
+                  "If more_changes_details includes 8888, more_changes_details_other must be English and not blank."),
+    Rule("book_comparison", "book_comparison cannot be blank.", "book_comparison",
+         lambda q: q.blank("book_comparison")),
+    Rule("book_modified", "If book_comparison=1 or 2, book_modified must not be blank.", "book_modified",
+         lambda q: q.isin("book_comparison", ["1", "2"]) & q.blank("book_modified")),
+    other_specify("book_modification_details", "book_modification_details_other",
+                  "If book_modification_details includes 8888, book_modification_details_other must be English and not blank."),
+    Rule("book_replacement_details", "If book_comparison=3, book_replacement_details must not be blank.",
+         "book_replacement_details",
+         lambda q: q.eq("book_comparison", "3") & q.blank("book_replacement_details")),
+    other_specify("book_replacement_details", "book_replacement_details_other",
+                  "If book_replacement_details includes 8888, book_replacement_details_other must be English and not blank."),
+    Rule("quality_change", "quality_change must only be 1,2,3,9999,7777 or blank.", "quality_change",
+         lambda q: ~q.isin("quality_change", ["", "1", "2", "3", "9999", "7777"])),
+    Rule("improvement_details", "If quality_change=1, improvement_details must not be blank.", "improvement_details",
+         lambda q: q.eq("quality_change", "1") & q.blank("improvement_details")),
+    other_specify("improvement_details", "improvement_details_other",
+                  "If improvement_details includes 8888, improvement_details_other must be English and not blank."),
+    Rule("worsening_details", "If quality_change includes 2, worsening_details must not be blank.",
+         "worsening_details",
+         lambda q: q.includes("quality_change", "2") & q.blank("worsening_details")),
+    other_specify("worsening_details", "worsening_details_other",
+                  "If worsening_details includes 8888, worsening_details_other must not be blank and must be in English."),
+
+    # Climate change
+    *[Rule(f, f"If Training_climate_change includes 1, {f} must not be blank.", f,
+           lambda q, f=f: q.includes("Training_climate_change", "1") & q.blank(f))
+      for f in ["training_cc_causes_effects", "training_cc_vulnerables_impacts",
+                "cc_understanding_risk_climate_hazards", "cc_understanding_adaptation_strategies",
+                "cc_materials_relevance", "cc_teaching"]],
+    Rule("cc_teaching_topics", "If cc_teaching includes 1, cc_teaching_topics must not be blank.",
+         "cc_teaching_topics",
+         lambda q: q.includes("cc_teaching", "1") & q.blank("cc_teaching_topics")),
+    translated("cc_teaching_topics", "cc_teaching_topics_Translation",
+               "If cc_teaching_topics has value, cc_teaching_topics_Translation must not be blank, '-' or non-English."),
+    *[Rule(f, f"If cc_teaching includes 1, {f} must not be blank.", f,
+           lambda q, f=f: q.includes("cc_teaching", "1") & q.blank(f))
+      for f in ["cc_teaching_use_visual_aids", "cc_teaching_use_local_examples",
+                "cc_teaching_participatory_methods"]],
+    translated("cc_training_challenges", "cc_training_challenges_Translation",
+               "If cc_training_challenges has value, cc_training_challenges_Translation must not be blank, '-' or non-English."),
+    translated("cc_training_suggestions", "cc_training_suggestions_Translation",
+               "If cc_training_suggestions has value, cc_training_suggestions_Translation must not be blank, '-' or non-English."),
+
+    # Transition and final comments
+    Rule("transition_activities_description",
+         "If transition_planning_activities includes 1, transition_activities_description must not be blank.",
+         "transition_activities_description",
+         lambda q: q.includes("transition_planning_activities", "1") & q.blank("transition_activities_description")),
+    translated("transition_activities_description", "transition_activities_description_Translation",
+               "If transition_activities_description has value, transition_activities_description_Translation must not be blank, '-' or non-English."),
+    translated("Final_comments", "Final_comments_Translation",
+               "If Final_comments has value, Final_comments_Translation must not be blank, '-' or non-English."),
+    Rule("Final_comments_Translation", "If Final_comments is blank, Final_comments_Translation must be blank or '-' only.",
+         "Final_comments_Translation",
+         lambda q: q.blank("Final_comments") & ~q.isin("Final_comments_Translation", ["", "-"])),
+
+    # Other adults present (other_adult_repeat sheet)
+    repeat_count_matches("other_adult_repeat_count", "other_adult_repeat"),
+    Rule("other_adult_name", "other_adults_present=1 but no records found in other_adult_repeat for this KEY.", None,
+         lambda q: q.eq("other_adults_present", "1") & (q.repeat_count("other_adult_repeat") == 0)),
+    Rule("other_adult_name",
+         "If other_adults_present=1, other_adult_name must not be blank and must be in English (no Dari/Pashto letters).",
+         "other_adult_name",
+         lambda c: c.up(c.parent.eq("other_adults_present", "1")) & c.not_english("other_adult_name"),
+         repeat="other_adult_repeat"),
+    Rule("other_adult_role_other",
+         "If other_adult_role=8888, other_adult_role_other must not be blank and must be in English (no Dari/Pashto letters).",
+         "other_adult_role_other",
+         lambda c: c.eq("other_adult_role", "8888") & c.not_english("other_adult_role_other"),
+         repeat="other_adult_repeat"),
+
+    # Attendance sheet
+    Rule("attendance_sheet_photo", "If attendance_sheet_available=1, attendance_sheet_photo must not be blank.",
+         "attendance_sheet_photo",
+         lambda q: q.eq("attendance_sheet_available", "1") & q.blank("attendance_sheet_photo")),
+    photo_qa("attendance_sheet_photo", "attendance_sheet_photo_QA",
+             "If attendance_sheet_photo exists, attendance_sheet_photo_QA must not be blank, '-' or outside the allowed values."),
+]
+
+RULES = scoped(consent_declined, DECLINED_RULES) + scoped(consent_given, CONSENTED_RULES)
@@ -0,0 +1,37 @@
+from core.qc_engine import Rule, qa_status_rules
+
+TOOL = "Tool 10"
+STATUS_COLUMN = "QC_Status"
+
+PHONE_RE = r"07\d{8}|0000000000"
+
+
+def _explained(flag, detail, blank_message):
+    """`detail` must be given, and in English, when `flag` holds."""
+    return [
+        Rule(detail, blank_message, detail,
+             lambda q: flag(q) & q.isin(detail, ["", "-"])),
+        Rule(detail, "Must be in English. Please translate.", detail,
+             lambda q: flag(q) & ~q.isin(detail, ["", "-"]) & ~q.ascii(detail)),
+    ]
+
+
+RULES = [
+    Rule("Consent", "Form cannot be No Consent.", "Consent",
+         lambda q: q.eq("Consent", "0")),
+    Rule("Full_name_of_respondent", "Respondent name must be in English.", "Full_name_of_respondent",
+         lambda q: q.filled("Full_name_of_respondent") & ~q.ascii("Full_name_of_respondent")),
+    Rule("Respondents_phone_number", "Phone number must be 10 digits starting with 07 or exactly 0000000000.",
+         "Respondents_phone_number",
+         lambda q: ~q.col("Respondents_phone_number").str.fullmatch(PHONE_RE)),
+    Rule("Final_comments_Translation", "Final comment must be translated.", "Final_comments_Translation",
+         lambda q: q.filled("Final_comments") & q.isin("Final_comments_Translation", ["", "-"])),
+    *qa_status_rules(),
+    *_explained(lambda q: q.includes("selection_criteria_subject_grade_availability", "8888"),
+                "selection_other_specify",
+                "Cannot be blank when 8888 is selected. Please provide reason in English."),
+    *_explained(lambda q: q.eq("female_accommodation_provided", "1"), "female_support_details",
+                "Cannot be blank when female_accommodation_provided is 1."),
+    *_explained(lambda q: q.eq("training_attendance_challenges", "1"), "challenge_details",
+                "Cannot be blank when training_attendance_challenges is 1."),
+]
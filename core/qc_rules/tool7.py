@@ -0,0 +1,48 @@
+from core.qc_engine import Rule, qa_status_rules, scoped
+
+TOOL = "Tool 7"
+STATUS_COLUMN = "QC_Status"
+
+PHONE_RE = r"07\d{8}|0000000000"
+
+
+def consent_declined(q):
+    return q.eq("Consent_Informed", "0")
+
+
+def consent_given(q):
+    return ~q.eq("Consent_Informed", "0")
+
+
+def _not_ascii(q, name):
+    return q.blank(name) | ~q.ascii(name)
+
+
+DECLINED_RULES = [
+    Rule("Remark",
+         "Consent_Informed is 'No'. Remark must clearly explain in English why consent was not taken.",
+         "QC_Remark",
+         lambda q: _not_ascii(q, "QC_Remark")),
+    Rule("Final_comments_Translation", "Final comment must be translated when consent is not given.",
+         "Final_comments_Translation",
+         lambda q: q.filled("Final_comments") & q.isin("Final_comments_Translation", ["", "-"])),
+]
+
+CONSENTED_RULES = [
+    Rule("Resp_name", "Name cannot be blank or non-English. Translate to English or fill correctly.", "Resp_name",
+         lambda q: _not_ascii(q, "Resp_name")),
+    Rule("Resp_designation_other", "Cannot be blank or non-English when 8888 selected. Translate and correct.",
+         "Resp_designation_other",
+         lambda q: q.includes("Resp_designation", "8888") & _not_ascii(q, "Resp_designation_other")),
+    Rule("Resp_phone", "Phone must start with 07 or be 0000000000. Correct number.", "Resp_phone",
+         lambda q: ~q.col("Resp_phone").str.fullmatch(PHONE_RE)),
+    Rule("sms_established_date", "Date cannot be in 2025. Verify correct date.", "sms_established_date",
+         lambda q: q.col("sms_established_date").str.startswith("2025")),
+    *qa_status_rules(),
+    Rule("Final_comments_Translation", "Final comment must be translated.", "Final_comments_Translation",
+         lambda q: q.filled("Final_comments") & q.isin("Final_comments_Translation", ["", "-"])),
+    Rule("Final_comments_Translation", "No comment exists, translation must be '-'.", "Final_comments_Translation",
+         lambda q: q.blank("Final_comments") & ~q.isin("Final_comments_Translation", ["-", ""])),
+]
+
+RULES = scoped(consent_declined, DECLINED_RULES) + scoped(consent_given, CONSENTED_RULES)
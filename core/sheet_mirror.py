@@ -0,0 +1,294 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+from gspread.utils import absolute_range_name, rowcol_to_a1
+
+MIRROR_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "sheets_mirror.sqlite")
+
+# Rows per checksum block when verifying the mirror against the sheet
+BLOCK_ROWS = 500
+
+# A sheet is re-downloaded in full at least this often, whatever the checksums say
+FULL_RESYNC_SECONDS = 24 * 3600
+
+
+def _cell(row, col):
+    return row[col] if col < len(row) else ""
+
+
+def _checksum(values) -> str:
+    return hashlib.sha1("\x1f".join(values).encode("utf-8")).hexdigest()
+
+
+def grid_frame(header, rows, categories=(), strip=()) -> pd.DataFrame:
+    """Column-oriented frame straight from a raw value grid, without per-row dicts.
+
+    Columns are pyarrow-backed strings; `categories` columns become categoricals (with
+    "" always a category, so fillna("") keeps working) and `strip` columns are stripped.
+    """
+    width = len(header)
+    padded = [r[:width] if len(r) >= width else r + [""] * (width - len(r)) for r in rows]
+    columns = list(zip(*padded)) if padded else [()] * width
+    data = {}
+    for i, (name, values) in enumerate(zip(header, columns)):
+        col = pd.Series(values, dtype="string[pyarrow]")
+        if name.strip() in strip:
+            col = col.str.strip()
+        if name.strip() in categories:
+            col = col.astype(pd.CategoricalDtype(sorted(set(col) | {""})))
+        data[i] = col
+    df = pd.DataFrame(data, index=pd.RangeIndex(len(padded)))
+    df.columns = header
+    return df
+
+
+def _positions(header, columns):
+    """Indexes in `header` of the mirrored `columns` (matched stripped); None mirrors every column."""
+    if columns is None:
+        return None
+    wanted = {c.strip() for c in columns}
+    return [i for i, h in enumerate(header) if h.strip() in wanted]
+
+
+def _projected(header, positions):
+    return list(header) if positions is None else [header[i] for i in positions]
+
+
+def _span(positions, first, last):
+    """A1 ranges for sheet rows first..last: the whole rows, or one range per mirrored column."""
+    if positions is None:
+        return [f"{first}:{last}"]
+    return [f"{rowcol_to_a1(first, p + 1)}:{rowcol_to_a1(last, p + 1)}" for p in positions]
+
+
+def _span_rows(positions, got):
+    """Rows back from the ranges of _span (one value range per mirrored column when projected)."""
+    if positions is None:
+        return list(got[0])
+    cols = [[_cell(r, 0) for r in v] for v in got]
+    n = max(map(len, cols), default=0)
+    return [[c[i] if i < len(c) else "" for c in cols] for i in range(n)]
+
+
+def _trim(rows):
+    """Drop trailing empty rows, as the Sheets API does for a full read."""
+    while rows and not any(rows[-1]):
+        rows.pop()
+    return rows
+
+
+class SheetMirror:
+    """Local SQLite copy of worksheets, kept current with delta syncs.
+
+    A sync fetches only the rows past the mirrored row count. It then checks the
+    `verify` columns (the ones that get edited in place, e.g. QC_Log's Status) block
+    by block against the mirror with checksums, and re-downloads only the blocks that
+    differ. A header change, or a sync more than FULL_RESYNC_SECONDS after the last full
+    download, re-downloads the whole sheet.
+
+    A sheet synced with `columns` is mirrored as those columns only: they are found by
+    name in the header row and every download fetches just their ranges.
+    """
+
+    def __init__(self, spreadsheet, path=MIRROR_PATH, block_rows=BLOCK_ROWS):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.spreadsheet = spreadsheet
+        self.path = path
+        self.block_rows = block_rows
+        self._lock = threading.Lock()
+        with self._connect() as con:
+            con.execute("CREATE TABLE IF NOT EXISTS sheets "
+                        "(name TEXT PRIMARY KEY, header TEXT, n_rows INTEGER, synced_at REAL, full_at REAL)")
+            con.execute("CREATE TABLE IF NOT EXISTS rows "
+                        "(sheet TEXT, row INTEGER, data TEXT, PRIMARY KEY (sheet, row))")
+            con.execute("CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY, header TEXT)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path)
+
+    def _state(self, name):
+        with self._connect() as con:
+            found = con.execute("SELECT header, n_rows, full_at FROM sheets WHERE name = ?", (name,)).fetchone()
+        if found is None:
+            return None
+        return json.loads(found[0]), found[1], found[2]
+
+    def _source(self, name):
+        """The worksheet's full header row at the last full download."""
+        with self._connect() as con:
+            found = con.execute("SELECT header FROM sources WHERE name = ?", (name,)).fetchone()
+        return json.loads(found[0]) if found else None
+
+    def values(self, name):
+        """(header, rows) as last synced; rows are lists of strings."""
+        state = self._state(name)
+        if state is None:
+            return [], []
+        with self._connect() as con:
+            rows = con.execute("SELECT data FROM rows WHERE sheet = ? ORDER BY row", (name,)).fetchall()
+        return state[0], [json.loads(r[0]) for r in rows]
+
+    def _save(self, name, header, rows, replace, full):
+        """Write rows {row number: values}; `replace` drops every mirrored row first."""
+        now = time.time()
+        with self._connect() as con:
+            if replace:
+                con.execute("DELETE FROM rows WHERE sheet = ?", (name,))
+            con.executemany("INSERT OR REPLACE INTO rows VALUES (?, ?, ?)",
+                            [(name, i, json.dumps(r, ensure_ascii=False)) for i, r in rows.items()])
+            n_rows = con.execute("SELECT COALESCE(MAX(row) + 1, 0) FROM rows WHERE sheet = ?", (name,)).fetchone()[0]
+            full_at = now if full else con.execute("SELECT full_at FROM sheets WHERE name = ?", (name,)).fetchone()[0]
+            con.execute("INSERT OR REPLACE INTO sheets VALUES (?, ?, ?, ?, ?)",
+                        (name, json.dumps(header, ensure_ascii=False), n_rows, now, full_at))
+
+    def _batch_get(self, ranges):
+        """Values of A1 `ranges` (sheet-qualified) in one spreadsheet-wide request."""
+        if not ranges:
+            return []
+        response = self.spreadsheet.values_batch_get(ranges)
+        return [vr.get("values", []) for vr in response["valueRanges"]]
+
+    def _save_full(self, name, source, rows, positions=None):
+        rows = _trim(list(rows))
+        self._save(name, _projected(source, positions), dict(enumerate(rows)), replace=True, full=True)
+        with self._connect() as con:
+            con.execute("INSERT OR REPLACE INTO sources VALUES (?, ?)", (name, json.dumps(source, ensure_ascii=False)))
+        return {"full": True, "appended": len(rows), "resynced": 0}
+
+    def _delta_ranges(self, name, verify, positions, row_count):
+        """Rows past the mirror and the `verify` columns of a mirrored sheet, as A1 ranges.
+
+        Verify columns are matched stripped, as _positions matches mirrored columns; one
+        the mirrored header doesn't have is a configuration error and raises ValueError.
+        """
+        header, n_rows, _ = self._state(name)
+        stripped = [h.strip() for h in header]
+        missing = [c for c in verify if c.strip() not in stripped]
+        if missing:
+            raise ValueError(f"{name}: verify columns {missing} are not among the mirrored columns {header}")
+        cols = [stripped.index(c.strip()) for c in verify] if n_rows else []
+        sheet_cols = cols if positions is None else [positions[c] for c in cols]
+        tail = _span(positions, n_rows + 2, row_count) if row_count >= n_rows + 2 else []
+        verified = [f"{rowcol_to_a1(2, c + 1)}:{rowcol_to_a1(n_rows + 1, c + 1)}" for c in sheet_cols]
+        return cols, tail, verified
+
+    def _changed_blocks(self, name, cols, verified):
+        """(start, end) row blocks whose checksum over the `cols` columns differs from the sheet."""
+        _, local_rows = self.values(name)
+        n_rows = len(local_rows)
+        remote_cols = [[_cell(r, 0) for r in v] + [""] * (n_rows - len(v)) for v in verified]
+        changed = []
+        for start in range(0, n_rows, self.block_rows):
+            end = min(start + self.block_rows, n_rows)
+            for c, remote in zip(cols, remote_cols):
+                if _checksum(remote[start:end]) != _checksum([_cell(r, c) for r in local_rows[start:end]]):
+                    changed.append((start, end))
+                    break
+        return local_rows, changed
+
+    def _save_delta(self, name, header, local_rows, appended, changed, blocks):
+        rows = {}
+        for (start, end), block in zip(changed, blocks):
+            block = list(block) + [[]] * (end - start - len(block))
+            rows.update({start + i: r for i, r in enumerate(block)})
+        n_rows = len(local_rows)
+        rows.update({n_rows + i: r for i, r in enumerate(appended)})
+
+        merged = [rows.get(i, r) for i, r in enumerate(local_rows)] + appended
+        n_merged = len(merged)
+        trimmed = len(_trim(merged)) < n_merged
+        if trimmed:
+            rows = dict(enumerate(merged))
+        self._save(name, header, rows, replace=trimmed, full=False)
+        return {"full": False, "appended": len(appended), "resynced": sum(e - s for s, e in changed)}
+
+    def sync(self, name, verify=(), full=False, columns=None) -> dict:
+        """Bring the mirror of worksheet `name` up to date; returns what was fetched."""
+        return self.sync_many({name: None if full else verify}, {name: columns})[name]
+
+    def sync_many(self, sheets: dict, columns: dict = None) -> dict:
+        """Sync several worksheets together: `sheets` maps name to its verify columns (None: full).
+
+        `columns` maps a name to the only columns to mirror of it. One metadata request,
+        one values request for every sheet's header, new rows and verify columns, and at
+        most one more for the blocks (or whole sheets) that changed.
+        """
+        columns = columns or {}
+        with self._lock:
+            row_counts = {ws.title: ws.row_count for ws in self.spreadsheet.worksheets()}
+            now = time.time()
+            plans = {}
+            for name, verify in sheets.items():
+                state, source = self._state(name), self._source(name)
+                positions = _positions(source, columns.get(name)) if source is not None else None
+                if (verify is None or state is None or source is None
+                        or now - (state[2] or 0) > FULL_RESYNC_SECONDS
+                        or state[0] != _projected(source, positions)):
+                    plans[name] = ("full", None, None)
+                else:
+                    plans[name] = ("delta", positions, self._delta_ranges(name, verify, positions, row_counts[name]))
+
+            first = []
+            for name, (kind, _, ranges) in plans.items():
+                if kind == "full":
+                    first.append(absolute_range_name(name, "1:1") if columns.get(name) is not None
+                                 else absolute_range_name(name))
+                else:
+                    cols, tail, verified = ranges
+                    first += [absolute_range_name(name, r) for r in ["1:1", *tail, *verified]]
+            fetched = iter(self._batch_get(first))
+
+            results, second, pending = {}, [], {}
+
+            def refetch(name, source):
+                if columns.get(name) is None:
+                    second.append(absolute_range_name(name))
+                    pending[name] = ("full", None, None)
+                    return
+                positions = _positions(source, columns[name])
+                second.extend(absolute_range_name(name, r) for r in _span(positions, 2, row_counts[name]))
+                pending[name] = ("full", positions, source)
+
+            for name, (kind, positions, ranges) in plans.items():
+                if kind == "full":
+                    values = next(fetched)
+                    if columns.get(name) is None:
+                        results[name] = self._save_full(name, values[0] if values else [], values[1:])
+                    else:
+                        refetch(name, values[0] if values else [])
+                    continue
+                cols, tail, verified = ranges
+                got_header = next(fetched)
+                got_tail = [next(fetched) for _ in tail]
+                got_verified = [next(fetched) for _ in verified]
+                source = got_header[0] if got_header else []
+                if source != self._source(name):
+                    refetch(name, source)
+                    continue
+                appended = _span_rows(positions, got_tail) if tail else []
+                local_rows, changed = self._changed_blocks(name, cols, got_verified)
+                for start, end in changed:
+                    second += [absolute_range_name(name, r) for r in _span(positions, start + 2, end + 1)]
+                pending[name] = ("delta", positions, (self._state(name)[0], local_rows, appended, changed))
+
+            fetched = iter(self._batch_get(second))
+            for name, (kind, positions, delta) in pending.items():
+                if kind == "full":
+                    source = delta
+                    if source is None:
+                        values = next(fetched)
+                        results[name] = self._save_full(name, values[0] if values else [], values[1:])
+                    else:
+                        got = [next(fetched) for _ in positions]
+                        results[name] = self._save_full(name, source, _span_rows(positions, got), positions)
+                    continue
+                header, local_rows, appended, changed = delta
+                per_block = 1 if positions is None else len(positions)
+                blocks = [_span_rows(positions, [next(fetched) for _ in range(per_block)]) for _ in changed]
+                results[name] = self._save_delta(name, header, local_rows, appended, changed, blocks)
+            return results
@@ -0,0 +1,112 @@
+import random
+import threading
+import time
+from collections import deque
+
+from gspread.exceptions import APIError
+
+# Rows per append_rows call; keeps each request well under the Sheets payload limit
+CHUNK_ROWS = 500
+
+# Sheets allows 60 read and 60 write requests per minute per user; leave room for other users
+REQUESTS_PER_MINUTE = 50
+
+MAX_RETRIES = 6
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """Blocks until another request fits in the per-minute budget (shared across threads)."""
+
+    def __init__(self, per_minute=REQUESTS_PER_MINUTE):
+        self.per_minute = per_minute
+        self._sent = deque()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= 60:
+                    self._sent.popleft()
+                if len(self._sent) < self.per_minute:
+                    self._sent.append(now)
+                    return
+                time.sleep(60 - (now - self._sent[0]))
+
+
+READ_LIMITER = RateLimiter()
+WRITE_LIMITER = RateLimiter()
+
+
+def _retryable(error: APIError, attempt):
+    return error.response.status_code in RETRY_STATUS and attempt < MAX_RETRIES
+
+
+def _backoff(attempt):
+    time.sleep(min(2 ** attempt, 64) + random.random())
+
+
+def call_with_backoff(request, limiter=READ_LIMITER):
+    """Run a Sheets request, retrying quota and server errors with exponential backoff and jitter.
+
+    Only for requests that are safe to repeat (reads, overwrites); appends go through
+    append_missing_rows.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.wait()
+        try:
+            return request()
+        except APIError as e:
+            if not _retryable(e, attempt):
+                raise
+            _backoff(attempt)
+
+
+def sheet_keys(ws, key_column="KEY") -> set:
+    """Stripped KEYs already in the worksheet (two small reads)."""
+    header = [h.strip() for h in call_with_backoff(lambda: ws.row_values(1))]
+    if key_column not in header:
+        return set()
+    column = call_with_backoff(lambda: ws.col_values(header.index(key_column) + 1))
+    return {k.strip() for k in column[1:]}
+
+
+def _append_chunk(ws, chunk, key_column):
+    """append_rows one chunk; before each retry drop the rows a failed call may still have written."""
+    total = len(chunk)
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt:
+            chunk = chunk[~chunk[key_column].str.strip().isin(sheet_keys(ws, key_column))]
+            if chunk.empty:
+                return total
+        WRITE_LIMITER.wait()
+        try:
+            ws.append_rows(chunk.values.tolist(), value_input_option="RAW")
+            return total
+        except APIError as e:
+            if not _retryable(e, attempt):
+                raise
+            _backoff(attempt)
+
+
+def append_missing_rows(ws, df, key_column="KEY", chunk_rows=CHUNK_ROWS, progress=None) -> int:
+    """Append the rows of `df` whose KEY is not in the worksheet yet; returns how many were added.
+
+    Rows go out in chunks of `chunk_rows` within the per-minute write budget, with
+    exponential backoff on quota and server errors. KEYs are read back from the sheet
+    first, and again before retrying a chunk whose outcome is unknown, so re-running
+    after a failure appends only what is still missing. `progress` is called with
+    (rows_done, rows_total) after each chunk.
+    """
+    df = df.fillna("").astype(str)
+    keys = df[key_column].str.strip()
+    existing = sheet_keys(ws, key_column)
+    todo = df[~keys.isin(existing) & ~keys.duplicated()]
+
+    added = 0
+    for start in range(0, len(todo), chunk_rows):
+        added += _append_chunk(ws, todo.iloc[start:start + chunk_rows], key_column)
+        if progress:
+            progress(min(start + chunk_rows, len(todo)), len(todo))
+    return added
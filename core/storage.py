@@ -0,0 +1,222 @@
+import argparse
+import csv
+import os
+import sys
+import threading
+from abc import ABC, abstractmethod
+
+from gspread.utils import a1_to_rowcol, absolute_range_name
+
+from core.sheet_mirror import SheetMirror
+from core.sheet_writer import WRITE_LIMITER, append_missing_rows, call_with_backoff
+
+
+def project(header, rows, columns=None):
+    """Only the `columns` of a value grid (matched stripped, in sheet order); None keeps all."""
+    if columns is None:
+        return header, rows
+    wanted = {c.strip() for c in columns}
+    keep = [i for i, h in enumerate(header) if h.strip() in wanted]
+    return [header[i] for i in keep], [[r[i] if i < len(r) else "" for i in keep] for r in rows]
+
+
+class SheetStorage(ABC):
+    """What the app needs from the project spreadsheet, whatever holds it.
+
+    Worksheets are read as raw grids (header, rows of strings) and written by name.
+    """
+
+    @abstractmethod
+    def read_many(self, names, columns=None) -> dict:
+        """name -> (header, rows) for each worksheet in `names`, limited to `columns`[name] if given."""
+        raise NotImplementedError
+
+    def read(self, name, columns=None):
+        return self.read_many([name], {name: columns})[name]
+
+    @abstractmethod
+    def append_missing_rows(self, name, df, key_column="KEY", progress=None) -> int:
+        """Append the rows of `df` whose KEY the worksheet doesn't have yet; returns how many."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def batch_update_many(self, updates):
+        """Overwrite cells of several worksheets: name -> list of {"range": "A1 range", "values": rows}.
+
+        Worksheets that don't exist yet are created.
+        """
+        raise NotImplementedError
+
+    def batch_update(self, name, updates):
+        """Overwrite cells of one worksheet, see batch_update_many."""
+        self.batch_update_many({name: updates})
+
+
+class GoogleSheetStorage(SheetStorage):
+    """The live spreadsheet: reads through a SheetMirror, writes through core.sheet_writer.
+
+    `columns` maps a worksheet to the only columns mirrored (and downloaded) of it; reads
+    can't ask for others. Worksheets without a `verify` entry aren't mirrored: they are
+    read in full, all of them in one batched request, and created by the first write to them.
+    """
+
+    def __init__(self, spreadsheet, write_spreadsheet=None, verify=None, columns=None):
+        self.mirror = SheetMirror(spreadsheet)
+        self.write_spreadsheet = write_spreadsheet or spreadsheet
+        self.verify = verify or {}
+        self.columns = columns or {}
+        self._worksheets = {}
+
+    def _worksheet(self, name):
+        if name not in self._worksheets:
+            self._worksheets[name] = self.write_spreadsheet.worksheet(name)
+        return self._worksheets[name]
+
+    def _list_worksheets(self) -> dict:
+        """Every worksheet by title, in one metadata request (also refreshes the handles _worksheet keeps)."""
+        self._worksheets = {ws.title: ws for ws in call_with_backoff(self.write_spreadsheet.worksheets)}
+        return self._worksheets
+
+    def _read_unmirrored(self, names) -> dict:
+        """Full grids of worksheets that aren't mirrored: one metadata and one values request for all of them."""
+        grids = {name: ([], []) for name in names}
+        if not names:
+            return grids
+        worksheets = self._list_worksheets()
+        present = [name for name in names if name in worksheets]
+        if present:
+            response = call_with_backoff(
+                lambda: self.write_spreadsheet.values_batch_get([absolute_range_name(name) for name in present]))
+            for name, value_range in zip(present, response["valueRanges"]):
+                values = value_range.get("values", [])
+                if values:
+                    grids[name] = (values[0], values[1:])
+        return grids
+
+    def read_many(self, names, columns=None) -> dict:
+        columns = columns or {}
+        mirrored = [name for name in names if name in self.verify]
+        if mirrored:
+            self.mirror.sync_many({name: self.verify[name] for name in mirrored}, self.columns)
+        grids = self._read_unmirrored([name for name in names if name not in self.verify])
+        grids.update({name: self.mirror.values(name) for name in mirrored})
+        return {name: project(*grids[name], columns.get(name)) for name in names}
+
+    def append_missing_rows(self, name, df, key_column="KEY", progress=None) -> int:
+        return append_missing_rows(self._worksheet(name), df, key_column=key_column, progress=progress)
+
+    def _fit_grids(self, updates):
+        """One structural request adding missing worksheets and growing those too small for `updates`."""
+        worksheets = self._list_worksheets()
+        requests = []
+        for name, ranges in updates.items():
+            rows, cols = 0, 0
+            for update in ranges:
+                row, col = a1_to_rowcol(update["range"].split(":")[0])
+                rows = max(rows, row - 1 + len(update["values"]))
+                cols = max(cols, col - 1 + max((len(v) for v in update["values"]), default=0))
+            ws = worksheets.get(name)
+            if ws is None:
+                grid = {"rowCount": max(rows, 1000), "columnCount": max(cols, 26)}
+                requests.append({"addSheet": {"properties": {"title": name, "gridProperties": grid}}})
+            elif rows > ws.row_count or cols > ws.col_count:
+                grid = {"rowCount": max(rows, ws.row_count), "columnCount": max(cols, ws.col_count)}
+                requests.append({"updateSheetProperties": {"properties": {"sheetId": ws.id, "gridProperties": grid},
+                                                           "fields": "gridProperties(rowCount,columnCount)"}})
+        if requests:
+            call_with_backoff(lambda: self.write_spreadsheet.batch_update({"requests": requests}), limiter=WRITE_LIMITER)
+            self._worksheets = {}
+
+    def batch_update_many(self, updates):
+        """Every worksheet's updates in one values request (after at most one request to fit the grids)."""
+        self._fit_grids(updates)
+        data = [{"range": absolute_range_name(name, update["range"]), "values": update["values"]}
+                for name, ranges in updates.items() for update in ranges]
+        call_with_backoff(lambda: self.write_spreadsheet.values_batch_update({"valueInputOption": "RAW", "data": data}),
+                          limiter=WRITE_LIMITER)
+
+
+class LocalSheetStorage(SheetStorage):
+    """Worksheets as UTF-8 CSV files (<folder>/<name>.csv), for offline runs, profiling and CI."""
+
+    def __init__(self, folder):
+        os.makedirs(folder, exist_ok=True)
+        self.folder = folder
+        self._lock = threading.Lock()
+
+    def _path(self, name):
+        return os.path.join(self.folder, f"{name}.csv")
+
+    def _load(self, name):
+        if not os.path.exists(self._path(name)):
+            return [], []
+        with open(self._path(name), newline="", encoding="utf-8") as f:
+            grid = list(csv.reader(f))
+        return (grid[0], grid[1:]) if grid else ([], [])
+
+    def save(self, name, header, rows):
+        with open(self._path(name), "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows([header, *rows])
+
+    def read_many(self, names, columns=None) -> dict:
+        columns = columns or {}
+        return {name: project(*self._load(name), columns.get(name)) for name in names}
+
+    def append_missing_rows(self, name, df, key_column="KEY", progress=None) -> int:
+        df = df.fillna("").astype(str)
+        with self._lock:
+            header, rows = self._load(name)
+            if not header:
+                header = list(df.columns)
+                self.save(name, header, [])
+            col = header.index(key_column) if key_column in header else None
+            existing = {r[col].strip() for r in rows if col is not None and col < len(r)}
+            keys = df[key_column].str.strip()
+            todo = df[~keys.isin(existing) & ~keys.duplicated()]
+            with open(self._path(name), "a", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerows(todo.values.tolist())
+        if progress and len(todo):
+            progress(len(todo), len(todo))
+        return len(todo)
+
+    def batch_update_many(self, updates):
+        with self._lock:
+            for name, ranges in updates.items():
+                self._update(name, ranges)
+
+    def _update(self, name, updates):
+        header, rows = self._load(name)
+        grid = [header, *rows]
+        for update in updates:
+            row, col = a1_to_rowcol(update["range"].split("!")[-1].split(":")[0])
+            for i, values in enumerate(update["values"]):
+                while len(grid) < row + i:
+                    grid.append([])
+                target = grid[row + i - 1]
+                target.extend([""] * (col - 1 + len(values) - len(target)))
+                target[col - 1:col - 1 + len(values)] = [str(v) for v in values]
+        self.save(name, grid[0] if grid else [], grid[1:])
+
+
+def copy_sheets(source: SheetStorage, target: LocalSheetStorage, names):
+    """Snapshot worksheets into a local store, e.g. to profile the pages offline."""
+    for name, (header, rows) in source.read_many(names).items():
+        target.save(name, header, rows)
+
+
+def main(argv=None):
+    from core.data_loader import MIRRORED_SHEETS, SPREADSHEET_KEY, get_client
+
+    parser = argparse.ArgumentParser(description="Copy worksheets of the project spreadsheet into CSV files.")
+    parser.add_argument("out", help="folder for the copies (point CBE_STORAGE_DIR at it to run the app on them)")
+    parser.add_argument("names", nargs="*", help="worksheets to copy (default: the ones the app reads)")
+    args = parser.parse_args(argv)
+
+    names = args.names or list(MIRRORED_SHEETS)
+    copy_sheets(GoogleSheetStorage(get_client().open_by_key(SPREADSHEET_KEY)), LocalSheetStorage(args.out), names)
+    print(f"{len(names)} worksheets copied to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, timedelta
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+try:
+    from python_calamine import CalamineWorkbook  # optional: pandas' much faster "calamine" engine
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+# Memory the parsed workbooks may hold in total (least recently used go first); override with CBE_WORKBOOK_CACHE_MB
+MAX_BYTES = int(os.environ.get("CBE_WORKBOOK_CACHE_MB", 1024)) * 2 ** 20
+
+_cache = OrderedDict()
+_cache_bytes = 0
+_lock = threading.Lock()
+
+
+def _content(file) -> bytes:
+    """Bytes of a path, an uploaded file or any file-like object (left rewound)."""
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            return f.read()
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    file.seek(0)
+    data = file.read()
+    file.seek(0)
+    return data
+
+
+def _size(sheets: dict) -> int:
+    return sum(int(df.memory_usage(index=True, deep=True).sum()) for df in sheets.values())
+
+
+def _cell(value, dtype):
+    """A cell value as pd.read_excel would give it (integral floats as ints, dates as Timestamps)."""
+    if value is None or value == "":
+        return np.nan
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    elif isinstance(value, (date, timedelta)):
+        value = pd.Timestamp(value) if isinstance(value, date) else pd.Timedelta(value)
+    return str(value) if dtype is str else value
+
+
+def _project_rows(rows, columns, dtype) -> pd.DataFrame:
+    """The `columns` of a sheet given as an iterator of rows (header first), keeping no other cell."""
+    header = [str(h) if h is not None else "" for h in next(rows, ())]
+    wanted = set(columns)
+    keep = {}
+    for i, h in enumerate(header):
+        if h in wanted and h not in keep:
+            keep[h] = i
+    picked, filled = [], 0
+    for row in rows:
+        picked.append([_cell(row[i], dtype) if i < len(row) else np.nan for i in keep.values()])
+        if any(v is not None and v != "" for v in row):
+            filled = len(picked)
+    del picked[filled:]
+    df = pd.DataFrame(picked, columns=list(keep), dtype=object)
+    return df if dtype is str else df.infer_objects()
+
+
+def _stream_columns(data, columns, dtype):
+    """The `columns` of the first sheet, streamed row by row (no other cell becomes a Python object).
+
+    With python-calamine the rows come from its iterator over the sheet (whose cells it
+    holds natively); otherwise from openpyxl in read-only mode.
+    """
+    if EXCEL_ENGINE:
+        wb = CalamineWorkbook.from_filelike(BytesIO(data))
+        try:
+            sheet = wb.get_sheet_by_index(0)
+            return {sheet.name: _project_rows(sheet.iter_rows(), columns, dtype)}
+        finally:
+            wb.close()
+    wb = load_workbook(BytesIO(data), read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        return {ws.title: _project_rows(ws.iter_rows(values_only=True), columns, dtype)}
+    finally:
+        wb.close()
+
+
+def _parse(data, dtype, columns=None):
+    """All sheets, or with `columns` only those columns of the first sheet."""
+    if columns is None:
+        return pd.read_excel(BytesIO(data), sheet_name=None, dtype=dtype, engine=EXCEL_ENGINE)
+    return _stream_columns(data, columns, dtype)
+
+
+def _lookup(key):
+    with _lock:
+        found = _cache.get(key)
+        if found is not None:
+            _cache.move_to_end(key)
+    return None if found is None else found[0]
+
+
+def _store(key, sheets):
+    global _cache_bytes
+    size = _size(sheets)
+    with _lock:
+        if key in _cache or size > MAX_BYTES:
+            return
+        _cache[key] = (sheets, size)
+        _cache_bytes += size
+        while _cache_bytes > MAX_BYTES:
+            _, (_, dropped) = _cache.popitem(last=False)
+            _cache_bytes -= dropped
+
+
+def _copies(sheets):
+    return {name: df.copy(deep=False) for name, df in sheets.items()}
+
+
+def _key(data, dtype, columns):
+    return hashlib.sha1(data).hexdigest(), str(dtype), None if columns is None else tuple(columns)
+
+
+def _cached(key):
+    """A cache hit for `key`; a column projection can also be cut from the whole workbook's entry."""
+    sheets = _lookup(key)
+    if sheets is None and key[2] is not None:
+        whole = _lookup(key[:2] + (None,))
+        if whole:
+            name, df = next(iter(whole.items()))
+            sheets = {name: df[[c for c in df.columns if c in key[2]]]}
+    return sheets
+
+
+def read_workbook(file, dtype=None, columns=None) -> dict:
+    """Every sheet of an .xlsx as {sheet name: DataFrame}, parsed once per distinct content.
+
+    Parsed workbooks are kept process-wide, keyed by a hash of the file's bytes, so a
+    Streamlit rerun with the same upload still in the uploader (or another session
+    uploading the same file) skips the parse. Least recently used workbooks are dropped
+    once they hold more than MAX_BYTES. Callers get shallow copies they may add columns to.
+
+    With `columns`, only the first sheet is read, and of it only those columns (those it
+    has): rows are streamed and every other cell is dropped as it is read, so no other
+    cell becomes a Python object. python-calamine, when installed, still loads the
+    sheet's cells natively (peak memory about a third lower than a full read);
+    openpyxl's read-only mode keeps next to nothing but parses about ten times slower.
+    """
+    data = _content(file)
+    key = _key(data, dtype, columns)
+    sheets = _cached(key)
+    if sheets is None:
+        sheets = _parse(data, dtype, columns)
+        _store(key, sheets)
+    return _copies(sheets)
+
+
+def read_workbooks(files: dict, dtype=None, workers=None, columns=None) -> dict:
+    """read_workbook for several files at once: {label: file} -> {label: sheets}.
+
+    Files are read on threads, and the ones not in the cache are parsed in a process
+    pool (`workers` processes, None for one per core), so the wait is about the
+    slowest file's parse rather than the sum of all of them.
+    """
+    with ThreadPoolExecutor(max_workers=len(files) or 1) as pool:
+        contents = dict(zip(files, pool.map(_content, files.values())))
+    keys = {label: _key(data, dtype, columns) for label, data in contents.items()}
+    found = {label: _cached(key) for label, key in keys.items()}
+
+    todo = {}
+    for label, sheets in found.items():
+        if sheets is None:
+            todo.setdefault(keys[label], contents[label])
+    workers = min(workers or os.cpu_count() or 1, len(todo))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = dict(zip(todo, pool.map(_parse, todo.values(), [dtype] * len(todo), [columns] * len(todo))))
+    else:
+        parsed = {key: _parse(data, dtype, columns) for key, data in todo.items()}
+    for key, sheets in parsed.items():
+        _store(key, sheets)
+
+    return {label: _copies(found[label] if found[label] is not None else parsed[keys[label]]) for label in files}
+
+
+def read_first_sheets(files: dict, dtype=None, workers=None, columns=None) -> dict:
+    """{label: file} -> {label: first sheet}, through read_workbooks."""
+    return {label: next(iter(sheets.values()))
+            for label, sheets in read_workbooks(files, dtype, workers, columns).items()}
@@ -1,10 +1,11 @@
 import streamlit as st
 import pandas as pd
-import gspread
-from google.oauth2.service_account import Credentials
 from io import BytesIO
 import os
 from theme.theme import apply_theme
+from core.calculations import missing_keys
+from core.data_loader import QC_LOG_SHEET, get_storage, load_sheet
+from core.workbook_cache import read_first_sheets
 apply_theme()
 
 st.set_page_config(page_title="CBE Dashboard Updater", layout="wide")
@@ -20,23 +21,10 @@ st.markdown(
 )
 st.divider()
 
-# ✅ (ثابت داخل کد)
-SPREADSHEET_URL = "https://docs.google.com/spreadsheets/d/1lkztBZ4eG1BQx-52XgnA6w8YIiw-Sm85pTlQQziurfw/edit?gid=742958808#gid=742958808"
-SHEET_NAME = "QC_Log"
-
-# ✅ فقط Credential از Secrets خوانده می‌شود (بدون فایل json لوکال)
-# در secrets.toml باید یک دیکشنری به نام gcp_service_account داشته باشید
-scope = ["https://www.googleapis.com/auth/spreadsheets"]
-creds = Credentials.from_service_account_info(
-    st.secrets["gcp_service_account"],
-    scopes=scope
-)
-client = gspread.authorize(creds)
-sheet = client.open_by_url(SPREADSHEET_URL).worksheet(SHEET_NAME)
+storage = get_storage()
 
 # خواندن دیتای فعلی QC_Log
-data = sheet.get_all_records()
-df_qc = pd.DataFrame(data)
+df_qc = load_sheet(QC_LOG_SHEET, columns=["KEY"])
 
 base_path = r"C:\Users\LENOVO\Documents\DATA"
 files = {
@@ -52,6 +40,13 @@ final_columns = [
     "Surveyor Name", "Surveyor ID", "Survey_Date"
 ]
 
+# Export columns the QC_Log rows are built from; only these are read from the workbooks
+source_columns = [
+    "KEY", "Province", "District", "Village",
+    "NAME_OF_THE_CBE", "School_name_in_English", "TPM_CBE_ID", "TPM_ID",
+    "Surveyor_Name", "Surveyor_Id", "starttime"
+]
+
 st.subheader("📥 Upload Excel files (Tool 1, 7, 10, 11)")
 uploaded_files = st.file_uploader(
     "Or use default path",
@@ -62,13 +57,13 @@ uploaded_files = st.file_uploader(
 if uploaded_files or all(os.path.exists(os.path.join(base_path, f)) for f in files.values()):
     merged_data = []
 
+    sources = {}
     for tool_name, file_name in files.items():
-        if uploaded_files:
-            file = next((f for f in uploaded_files if f.name == file_name), None)
-            df = pd.read_excel(file) if file else pd.read_excel(os.path.join(base_path, file_name))
-        else:
-            df = pd.read_excel(os.path.join(base_path, file_name))
+        file = next((f for f in uploaded_files if f.name == file_name), None) if uploaded_files else None
+        sources[tool_name] = file if file else os.path.join(base_path, file_name)
+    frames = read_first_sheets(sources, dtype=str, columns=source_columns)
 
+    for tool_name, df in frames.items():
         if tool_name in ["Tool 1", "Tool 7"]:
             cbe_school_name = df.get("NAME_OF_THE_CBE", "")
             tpm_id = df.get("TPM_CBE_ID", "")
@@ -95,8 +90,7 @@ if uploaded_files or all(os.path.exists(os.path.join(base_path, f)) for f in fil
 
     final_df = pd.concat(merged_data, ignore_index=True)[final_columns]
 
-    existing_keys = set(df_qc.get("KEY", pd.Series([], dtype=str)).astype(str).tolist())
-    new_rows = final_df[~final_df["KEY"].astype(str).isin(existing_keys)]
+    new_rows = final_df[missing_keys(final_df["KEY"], df_qc.get("KEY", pd.Series([], dtype=str)))]
 
     st.subheader("🔑 New Keys")
     st.dataframe(new_rows)
@@ -115,7 +109,9 @@ if uploaded_files or all(os.path.exists(os.path.join(base_path, f)) for f in fil
 
         if st.button("Add in Dashboard"):
             new_rows_clean = new_rows.fillna("").astype(str)
-            sheet.append_rows(new_rows_clean.values.tolist(), value_input_option="RAW")
-            st.success("✅ New rows successfully added to QC_Log.")
+            bar = st.progress(0.0, text="Adding rows to QC_Log...")
+            added = storage.append_missing_rows(QC_LOG_SHEET, new_rows_clean,
+                                                progress=lambda done, total: bar.progress(done / total))
+            st.success(f"✅ {added} new rows successfully added to QC_Log.")
     else:
         st.success("✅ All keys already exist in QC_Log.")
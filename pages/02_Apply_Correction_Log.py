@@ -1,27 +1,16 @@
 import streamlit as st
 import pandas as pd
 from io import BytesIO
-import gspread
-from google.oauth2.service_account import Credentials
+from core.data_loader import CORRECTION_LOG_SHEET, load_sheet
+from core.workbook_cache import read_workbook
 from theme.theme import apply_theme
 apply_theme()
 
 st.set_page_config(page_title="CBE Correction Log", layout="wide")
 st.title("Apply Correction Log to Uploaded File")
 
-SPREADSHEET_KEY = "1lkztBZ4eG1BQx-52XgnA6w8YIiw-Sm85pTlQQziurfw"
-CORRECTION_SHEET = "Correction_Log"
-
 def load_corrections():
-    scopes = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
-    creds = Credentials.from_service_account_info(
-        st.secrets["gcp_service_account"],
-        scopes=scopes
-    )
-    client = gspread.authorize(creds)
-    ws = client.open_by_key(SPREADSHEET_KEY).worksheet(CORRECTION_SHEET)
-    df = pd.DataFrame(ws.get_all_records())
-    df.columns = [c.strip() for c in df.columns]
+    df = load_sheet(CORRECTION_LOG_SHEET)
     required = {"Tool_Name", "Sheet_name", "KEY", "Question", "new_value"}
     if not required.issubset(df.columns):
         raise ValueError("Invalid Correction_Log structure")
@@ -33,7 +22,7 @@ if not uploaded_file:
     st.stop()
 
 try:
-    all_sheets = pd.read_excel(uploaded_file, sheet_name=None, dtype=str)
+    all_sheets = read_workbook(uploaded_file, dtype=str)
 except Exception as e:
     st.error(str(e))
     st.stop()
@@ -0,0 +1,98 @@
+import streamlit as st
+from io import BytesIO
+from core.data_loader import ISSUES_SHEET, get_storage, load_qc_log, qc_log_refresh_control
+from core.helpers import read_tool_workbook
+from core.issue_sheet import publish_issues, reviewer_sheets
+from core.pipeline import run_pipeline, tool_of
+from core.qc_engine import profile_table
+from core.qc_rules import TOOLS
+
+st.set_page_config(page_title="All Tools QC Issues", layout="wide")
+st.title("🛠 All Tools QC Issues")
+
+users = ["All",
+         "Waris Amini", "Shabeer Ahmad Ahsas", "Romal wali",
+         "Abrahim Ahrahimi", "Abdullah Deldar", "Hedayatullah Setanikzai",
+         "A.Azim Hashimi", "Abed Ahmadzai", "Ahmad Akbari",
+         "Inamullah Salamzai", "Hashmatullah Amarkhil", "Jalil Ahmad Jamal",
+         "Khalid Ammar", "M.Samim Kohistani", "Meena Yawari",
+         "Noryalai Hotak", "Sejadullah Safi", "Shahedullah Noorzad"]
+selected_user = st.selectbox("Select your name", users)
+
+tool_files = st.file_uploader(f"Upload the {', '.join(TOOLS)} Excel files", type=["xlsx"], accept_multiple_files=True)
+
+if tool_files:
+    workbooks = {}
+    for f in tool_files:
+        tool = tool_of(f.name)
+        if tool is None:
+            st.warning(f"Skipped {f.name}: the file name must start with one of {', '.join(TOOLS)}.")
+            continue
+        try:
+            workbooks[tool] = read_tool_workbook(f)
+        except Exception as e:
+            st.error(f" Failed to read {f.name}: {e}")
+            st.stop()
+
+    if not workbooks:
+        st.stop()
+
+    try:
+        df_qc = load_qc_log()
+    except Exception as e:
+        st.error(f" Failed to load QC_Log: {e}")
+        st.stop()
+    qc_log_refresh_control()
+
+    if selected_user == "All":
+        df_qc_user = df_qc.copy()
+    else:
+        df_qc_user = df_qc[df_qc["QC By"] == selected_user]
+
+    if df_qc_user.empty:
+        st.info("✅ No keys assigned to you in QC_Log.")
+    else:
+        profile = []
+        df_issues = run_pipeline(workbooks, df_qc_user,
+                                 workers=None if selected_user == "All" else 1, profile=profile)
+
+        if not df_issues.empty:
+            st.error(f"⚠ {len(df_issues)} issues detected.")
+            counts = df_issues["Tool"].value_counts()
+            st.write(" | ".join(f"{tool}: {counts.get(tool, 0)}" for tool in workbooks))
+            st.dataframe(df_issues)
+
+            buffer = BytesIO()
+            df_issues.to_excel(buffer, index=False)
+            buffer.seek(0)
+            st.download_button(
+                label="⬇ Download Issues Report",
+                data=buffer,
+                file_name=f"AllTools_Issues_{selected_user}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+        else:
+            st.success("✅ No issues found for your assigned keys.")
+
+        if selected_user == "All":
+            target = f"{ISSUES_SHEET}_<reviewer>"
+        else:
+            target = reviewer_sheets(ISSUES_SHEET, [selected_user])[selected_user]
+        if st.button(f"📤 Publish to {target}"):
+            try:
+                published = publish_issues(get_storage(), ISSUES_SHEET, df_issues, df_qc_user, list(workbooks), selected_user)
+            except Exception as e:
+                st.error(f" Failed to publish issues: {e}")
+            else:
+                st.success(f"✅ {published} issues published to {target}.")
+
+        with st.expander("⏱ Rule profile (time, rows and issues per check)"):
+            st.caption("Only submissions checked in this run are counted; those reused from the cache were not profiled.")
+            df_profile = profile_table(profile)
+            st.dataframe(df_profile)
+            st.download_button(
+                label="⬇ Download Rule Profile (CSV)",
+                data=df_profile.to_csv(index=False).encode("utf-8"),
+                file_name=f"AllTools_Rule_Profile_{selected_user}.csv",
+                mime="text/csv"
+            )
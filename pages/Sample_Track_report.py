@@ -30,6 +30,7 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
+from core.data_loader import SAMPLE_TRACK_SHEET, cached_sheet_version, load_cached_sheet
 
 # =========================
 # Page Config
@@ -146,12 +147,6 @@ st.markdown("""
 
 st.markdown('<div class="app-header">Sample Track Analytics Dashboard</div>', unsafe_allow_html=True)
 
-# =========================
-# Google Sheet Config
-# =========================
-SPREADSHEET_KEY = "1lkztBZ4eG1BQx-52XgnA6w8YIiw-Sm85pTlQQziurfw"
-WORKSHEET_NAME = "Test"
-
 # =========================
 # Text Normalization
 # =========================
@@ -288,32 +283,18 @@ def build_tool_view(df_raw: pd.DataFrame, tool: str) -> pd.DataFrame:
 # =========================
 # Google Sheet loader
 # =========================
-@st.cache_data(ttl=600)
 def load_google_sheet():
-    import gspread
-    from google.oauth2.service_account import Credentials
-
-    scopes = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
-    
-    # Check if secrets are available
-    if "gcp_service_account" not in st.secrets:
-        st.error("GCP Service Account credentials not found in secrets. Please add them to your Streamlit secrets.")
-        return pd.DataFrame()
-    
     try:
-        creds = Credentials.from_service_account_info(st.secrets["gcp_service_account"], scopes=scopes)
-        client = gspread.authorize(creds)
-
-        sh = client.open_by_key(SPREADSHEET_KEY)
-        ws = sh.worksheet(WORKSHEET_NAME)
-        data = ws.get_all_records()
-        df = pd.DataFrame(data)
-        df.columns = [str(c).strip() for c in df.columns]
-        return df
+        return load_cached_sheet(SAMPLE_TRACK_SHEET)
     except Exception as e:
         st.error(f"Error loading Google Sheet: {e}")
         return pd.DataFrame()
 
+@st.cache_data(show_spinner=False, max_entries=12)
+def load_tool_view(sheet_version: str, tool: str) -> pd.DataFrame:
+    # Keyed on the sheet's content checksum: a refresh that finds the sheet unchanged reuses the view
+    return build_tool_view(load_google_sheet(), tool)
+
 # =========================
 # GeoBoundaries Fetchers
 # =========================
@@ -1210,7 +1191,7 @@ tool_choice = st.sidebar.selectbox(
 )
 
 try:
-    df = build_tool_view(df_sheet, tool_choice)
+    df = load_tool_view(cached_sheet_version(SAMPLE_TRACK_SHEET), tool_choice)
 except Exception as e:
     st.error(f"Error processing data: {e}")
     st.stop()
@@ -1,26 +1,19 @@
 import streamlit as st
 import pandas as pd
-import gspread
-from google.oauth2.service_account import Credentials
 from io import BytesIO
 from theme.theme import apply_theme
+from core.calculations import join_on_key, missing_keys
+from core.data_loader import QC_LOG_SHEET, get_storage, load_sheet
+from core.workbook_cache import read_first_sheets
 apply_theme()
 
 st.set_page_config(page_title="CBE Dashboard Updater", layout="wide")
 
 page = st.sidebar.selectbox("Select Page", ["Updater", "Status"])
 
-SPREADSHEET_URL = "https://docs.google.com/spreadsheets/d/1lkztBZ4eG1BQx-52XgnA6w8YIiw-Sm85pTlQQziurfw/edit?gid=742958808#gid=742958808"
-SHEET_NAME = "QC_Log"
+storage = get_storage()
 
-scope = ["https://www.googleapis.com/auth/spreadsheets"]
-creds = Credentials.from_service_account_info(st.secrets["gcp_service_account"], scopes=scope)
-client = gspread.authorize(creds)
-sheet = client.open_by_url(SPREADSHEET_URL).worksheet(SHEET_NAME)
-
-df_qc = pd.DataFrame(sheet.get_all_records())
-if not df_qc.empty and "KEY" in df_qc.columns:
-    df_qc["KEY"] = df_qc["KEY"].astype(str)
+df_qc = load_sheet(QC_LOG_SHEET, columns=["KEY", "Status", "QC By"])
 
 files = {
     "Tool 1": "Tool 1 CBE Classroom and Teacher.xlsx",
@@ -29,6 +22,14 @@ files = {
     "Tool 11": "Tool 11 – Public-School Principal Interview and Observation Checklist (School Infrastructure).xlsx"
 }
 
+# Export columns each page reads; only these are read from the workbooks
+source_columns = [
+    "KEY", "Province", "District", "Village",
+    "NAME_OF_THE_CBE", "School_name_in_English", "TPM_CBE_ID", "TPM_ID",
+    "Surveyor_Name", "Surveyor_Id", "starttime"
+]
+status_columns = ["KEY", "review_status", "QA_By", "QA_status"]
+
 st.subheader("Upload Excel files (Tool 1, 7, 10, 11)")
 uploaded_files = st.file_uploader("Upload all required files", type=["xlsx"], accept_multiple_files=True)
 
@@ -40,10 +41,16 @@ if missing:
     st.write(missing)
     st.stop()
 
-def read_tool_df(tool_name, file_obj):
-    df = pd.read_excel(file_obj)
-    if "KEY" in df.columns:
-        df["KEY"] = df["KEY"].astype(str)
+# Each upload is parsed once, as text, with the columns of both pages; switching pages
+# (or any other rerun with the same uploads) reuses the frames without reading the files
+upload_ids = tuple(uploaded_map[file_name].file_id for file_name in files.values())
+if st.session_state.get("status_uploads", (None, None))[0] != upload_ids:
+    parsed = read_first_sheets({tool_name: uploaded_map[file_name] for tool_name, file_name in files.items()},
+                               dtype=str, columns=list(dict.fromkeys(source_columns + status_columns)))
+    st.session_state["status_uploads"] = (upload_ids, parsed)
+frames = st.session_state["status_uploads"][1]
+
+def read_tool_df(tool_name, df):
     if tool_name in ["Tool 1", "Tool 7"]:
         cbe_school_name = df.get("NAME_OF_THE_CBE", pd.Series([""] * len(df)))
         tpm_id = df.get("TPM_CBE_ID", pd.Series([""] * len(df)))
@@ -66,9 +73,7 @@ def read_tool_df(tool_name, file_obj):
     return out
 
 def build_merged_tools():
-    merged = []
-    for tool_name, file_name in files.items():
-        merged.append(read_tool_df(tool_name, uploaded_map[file_name]))
+    merged = [read_tool_df(tool_name, frames[tool_name]) for tool_name in files]
     final_columns = [
         "KEY", "Tool Name", "Province", "District", "Village",
         "CBE/School Name", "TPM CBE/School ID",
@@ -88,12 +93,8 @@ if page == "Updater":
 
     final_df = build_merged_tools()
 
-    if df_qc.empty or "KEY" not in df_qc.columns:
-        existing_keys = set()
-    else:
-        existing_keys = set(df_qc["KEY"].astype(str).tolist())
-
-    new_rows = final_df[~final_df["KEY"].astype(str).isin(existing_keys)]
+    existing_keys = df_qc.get("KEY", pd.Series([], dtype=str))
+    new_rows = final_df[missing_keys(final_df["KEY"], existing_keys)]
 
     st.subheader("New Keys")
     st.dataframe(new_rows, use_container_width=True)
@@ -115,8 +116,10 @@ if page == "Updater":
 
     if st.button("Add to QC_Log"):
         new_rows_clean = new_rows.fillna("").astype(str)
-        sheet.append_rows(new_rows_clean.values.tolist(), value_input_option="RAW")
-        st.success("New rows added to QC_Log successfully.")
+        bar = st.progress(0.0, text="Adding rows to QC_Log...")
+        added = storage.append_missing_rows(QC_LOG_SHEET, new_rows_clean,
+                                            progress=lambda done, total: bar.progress(done / total))
+        st.success(f"{added} new rows added to QC_Log successfully.")
 
 elif page == "Status":
     st.title("CBE Dashboard Status Checker")
@@ -129,10 +132,7 @@ elif page == "Status":
     st.divider()
 
     merged = []
-    for tool_name, file_name in files.items():
-        df = pd.read_excel(uploaded_map[file_name], dtype=str)
-        if "KEY" in df.columns:
-            df["KEY"] = df["KEY"].astype(str)
+    for tool_name, df in frames.items():
         merged.append(pd.DataFrame({
             "KEY": df.get("KEY", pd.Series([""] * len(df))).astype(str),
             "Tool Name": tool_name,
@@ -151,12 +151,11 @@ elif page == "Status":
             if c not in df_qc.columns:
                 df_qc[c] = ""
         df_qc_status = df_qc[["KEY", "Status", "QC By"]].copy()
-        df_qc_status["KEY"] = df_qc_status["KEY"].astype(str)
         df_qc_status["GS_Status"] = df_qc_status["Status"].fillna("").astype(str)
         df_qc_status["QC By"] = df_qc_status["QC By"].fillna("").astype(str)
         df_qc_status = df_qc_status.drop(columns=["Status"])
 
-    comparison_df = final_df.merge(df_qc_status, on="KEY", how="left").fillna({"GS_Status": "", "QC By": ""})
+    comparison_df = join_on_key(final_df, df_qc_status, ["QC By", "GS_Status"])
     output_df = comparison_df[["KEY", "Tool Name", "QC By", "GS_Status", "DS_Status", "QA_By", "QA_status"]]
 
     st.subheader("Status Comparison")